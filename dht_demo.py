@@ -18,7 +18,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from bencode import encode, decode
-from node import Node, distance, generate_node_id
+from node import Node, distance, generate_node_id, generate_node_ids
 from routing_table import RoutingTable
 from protocol import (
     create_ping_query,
@@ -206,8 +206,8 @@ def demo_simulated_lookup():
     table = RoutingTable(local_id, k=8)
     print("\n1. Populating routing table with 50 nodes...")
 
-    for i in range(50):
-        node = Node(generate_node_id(), f'10.0.{i//256}.{i%256}', 6881 + i)
+    for i, node_id in enumerate(generate_node_ids(50)):
+        node = Node(node_id, f'10.0.{i//256}.{i%256}', 6881 + i)
         table.add_node(node)
 
     print("   ✓ Routing table populated")
@@ -52,41 +52,60 @@ def encode(obj: Union[int, bytes, list, dict]) -> bytes:
         - Dict keys must be bytes to prevent encoding errors
         - Integer size is limited by Python's int implementation
     """
+    parts: List[bytes] = []
+    _encode_into(obj, parts)
+    return b''.join(parts)
+
+
+def _encode_into(obj: Union[int, bytes, list, dict], parts: List[bytes]) -> None:
+    """
+    Append the bencode encoding of obj to a list of byte fragments.
+
+    Encoding into a shared list and joining once at the end avoids the
+    quadratic copying of repeated bytes concatenation for nested values.
+
+    Args:
+        obj: The object to encode (int, bytes, list, or dict)
+        parts: List that receives the encoded fragments
+
+    Raises:
+        TypeError: If obj is not a supported type or a dict key is not bytes
+        ValueError: If integer is too large to encode safely
+    """
     # Integer encoding: i<number>e
     if isinstance(obj, int):
         # Validate integer size (prevent potential DoS with huge numbers)
         if abs(obj) > 10**100:  # Reasonable limit for DHT protocol
             raise ValueError(f"Integer too large to encode safely: {obj}")
-        return b'i' + str(obj).encode('ascii') + b'e'
+        parts.append(b'i%de' % obj)
 
     # Byte string encoding: <length>:<contents>
     elif isinstance(obj, bytes):
-        return str(len(obj)).encode('ascii') + b':' + obj
+        parts.append(b'%d:' % len(obj))
+        parts.append(obj)
 
     # List encoding: l<elements>e
     elif isinstance(obj, list):
-        result = b'l'
+        parts.append(b'l')
         for item in obj:
-            result += encode(item)  # Recursive encoding
-        result += b'e'
-        return result
+            _encode_into(item, parts)  # Recursive encoding
+        parts.append(b'e')
 
     # Dictionary encoding: d<key><value>...e
     # Keys must be sorted in lexicographic order (BitTorrent spec requirement)
     elif isinstance(obj, dict):
-        result = b'd'
         # Validate that all keys are bytes
         for key in obj.keys():
             if not isinstance(key, bytes):
                 raise TypeError(f"Dictionary keys must be bytes, got {type(key)}")
 
+        parts.append(b'd')
         # Sort keys lexicographically as required by bencode spec
-        sorted_keys = sorted(obj.keys())
-        for key in sorted_keys:
-            result += encode(key)  # Encode key
-            result += encode(obj[key])  # Encode value (recursive)
-        result += b'e'
-        return result
+        for key in sorted(obj.keys()):
+            parts.append(b'%d:' % len(key))  # Encode key
+            parts.append(key)
+            _encode_into(obj[key], parts)  # Encode value (recursive)
+        parts.append(b'e')
 
     else:
         raise TypeError(f"Unsupported type for bencode: {type(obj)}")
@@ -132,16 +151,49 @@ def decode(data: bytes) -> tuple[Any, int]:
     if not data:
         raise ValueError("Cannot decode empty data")
 
+    return decode_at(data, 0)
+
+
+def decode_at(data: bytes, index: int) -> tuple[Any, int]:
+    """
+    Decode the bencode value starting at a given offset.
+
+    Works on absolute offsets into the original buffer instead of slicing
+    off the remaining data for every nested value, so decoding a message
+    never copies it. Also useful to callers that locate a value inside a
+    larger bencoded buffer themselves.
+
+    Args:
+        data: The complete bencode-encoded buffer
+        index: Offset of the first byte of the value to decode
+
+    Returns:
+        tuple: A tuple containing:
+            - decoded object (int, bytes, list, or dict)
+            - offset just past the decoded value
+
+    Raises:
+        ValueError: If data is malformed, truncated, or contains invalid bencode.
+
+    Examples:
+        >>> decode_at(b'4:spami42e', 6)
+        (42, 10)
+    """
+    if index >= len(data):
+        raise ValueError("Cannot decode empty data")
+
+    lead = data[index:index + 1]
+
     # Integer decoding: i<number>e
-    if data[0:1] == b'i':
+    if lead == b'i':
         try:
             # Find the terminating 'e'
-            end_index = data.index(b'e', 1)
+            end_index = data.index(b'e', index + 1)
         except ValueError:
             raise ValueError("Invalid integer: missing terminator 'e'")
 
         # Extract and parse the number
-        number_bytes = data[1:end_index]
+        number_bytes = data[index + 1:end_index]
         if not number_bytes:
             raise ValueError("Invalid integer: empty value")
 
@@ -159,15 +211,15 @@ def decode(data: bytes) -> tuple[Any, int]:
         return number, end_index + 1
 
     # Byte string decoding: <length>:<contents>
-    elif data[0:1].isdigit():
+    elif lead.isdigit():
         try:
             # Find the colon separator
-            colon_index = data.index(b':', 0)
+            colon_index = data.index(b':', index)
         except ValueError:
             raise ValueError("Invalid byte string: missing colon separator")
 
         # Extract and parse the length
-        length_bytes = data[0:colon_index]
+        length_bytes = data[index:colon_index]
         if not length_bytes:
             raise ValueError("Invalid byte string: empty length")
 
@@ -194,20 +246,19 @@ def decode(data: bytes) -> tuple[Any, int]:
         return byte_string, end_index
 
     # List decoding: l<elements>e
-    elif data[0:1] == b'l':
+    elif lead == b'l':
         result = []
-        index = 1  # Skip the 'l'
+        index += 1  # Skip the 'l'
 
         while index < len(data):
             # Check for list terminator
-            if data[index:index+1] == b'e':
+            if data[index] == 0x65:  # ord('e')
                 return result, index + 1
 
             # Decode next element
             try:
-                element, consumed = decode(data[index:])
+                element, index = decode_at(data, index)
                 result.append(element)
-                index += consumed
             except (ValueError, IndexError) as e:
                 raise ValueError(f"Invalid list element at position {index}: {e}")
 
@@ -215,21 +266,21 @@ def decode(data: bytes) -> tuple[Any, int]:
         raise ValueError("Invalid list: missing terminator 'e'")
 
     # Dictionary decoding: d<key><value>...e
-    elif data[0:1] == b'd':
+    elif lead == b'd':
         result = {}
-        index = 1  # Skip the 'd'
+        index += 1  # Skip the 'd'
 
         while index < len(data):
             # Check for dict terminator
-            if data[index:index+1] == b'e':
+            if data[index] == 0x65:  # ord('e')
                 return result, index + 1
 
             # Decode key (must be a byte string)
             try:
-                key, consumed = decode(data[index:])
+                key, next_index = decode_at(data, index)
                 if not isinstance(key, bytes):
                     raise ValueError(f"Dictionary key must be byte string, got {type(key)}")
-                index += consumed
+                index = next_index
             except (ValueError, IndexError) as e:
                 raise ValueError(f"Invalid dictionary key at position {index}: {e}")
 
@@ -238,9 +289,8 @@ def decode(data: bytes) -> tuple[Any, int]:
                 raise ValueError("Invalid dictionary: missing value for key")
 
             try:
-                value, consumed = decode(data[index:])
+                value, index = decode_at(data, index)
                 result[key] = value
-                index += consumed
             except (ValueError, IndexError) as e:
                 raise ValueError(f"Invalid dictionary value at position {index}: {e}")
 
@@ -248,4 +298,4 @@ def decode(data: bytes) -> tuple[Any, int]:
         raise ValueError("Invalid dictionary: missing terminator 'e'")
 
     else:
-        raise ValueError(f"Invalid bencode: unexpected byte {data[0]}")
+        raise ValueError(f"Invalid bencode: unexpected byte {data[index]}")
@@ -18,14 +18,16 @@ import random
 from typing import Dict, List, Set, Tuple, Optional, Callable
 from collections import defaultdict
 
-from node import Node, generate_node_id, distance
+from node import Node, generate_node_id
 from routing_table import RoutingTable
+from lookup_cache import RecentClosest
 from protocol import (
     create_ping_query,
     create_find_node_query,
     create_get_peers_query,
     parse_message,
-    unpack_nodes
+    unpack_nodes,
+    unpack_peers
 )
 
 
@@ -80,6 +82,9 @@ class DHTClient:
         self.port = port
         self.routing_table = RoutingTable(self.node_id, k=8)
 
+        # Closest nodes from recent lookups, used to seed repeat lookups
+        self.lookup_cache = RecentClosest(k=8)
+
         # Communication
         self.socket = None
         self.running = False
@@ -183,9 +188,13 @@ class DHTClient:
                     if b'r' in response and b'nodes' in response[b'r']:
                         nodes_data = response[b'r'][b'nodes']
                         nodes = unpack_nodes(nodes_data)
+                        valid_nodes = []
                         for node_id, node_ip, node_port in nodes:
-                            node = Node(node_id, node_ip, node_port)
-                            self.routing_table.add_node(node)
+                            try:
+                                valid_nodes.append(Node(node_id, node_ip, node_port))
+                            except ValueError:
+                                continue  # e.g. port 0, seen in real traffic
+                        self.routing_table.add_nodes(valid_nodes)
                         success_count += 1
                         print(f"[DHT] Bootstrap: received {len(nodes)} nodes from {addr[0]}")
 
@@ -234,13 +243,21 @@ class DHTClient:
         queried: Set[bytes] = set()
         found_nodes: Dict[bytes, Node] = {node.node_id: node for node in closest}
 
+        # Rank candidates by XOR against the target as an integer, computed
+        # once; each Node already carries its ID as an integer
+        target_int = int.from_bytes(target_id, byteorder='big')
+
+        # Seed with the closest nodes from a recent lookup of this target
+        for node in self.lookup_cache.get(target_id):
+            found_nodes.setdefault(node.node_id, node)
+
         # Iterative lookup
         for _ in range(3):  # Limit iterations
             # Get unqueried closest nodes
             to_query = [
                 node for node in sorted(
                     found_nodes.values(),
-                    key=lambda n: distance(n.node_id, target_id)
+                    key=lambda n: n._id_int ^ target_int
                 )[:count]
                 if node.node_id not in queried
             ]
@@ -256,10 +273,17 @@ class DHTClient:
                     if b'r' in response and b'nodes' in response[b'r']:
                         nodes_data = response[b'r'][b'nodes']
                         nodes = unpack_nodes(nodes_data)
+                        new_nodes = []
                         for node_id, node_ip, node_port in nodes:
-                            if node_id not in found_nodes:
-                                found_nodes[node_id] = Node(node_id, node_ip, node_port)
-                                self.routing_table.add_node(found_nodes[node_id])
+                            if node_id in found_nodes:
+                                continue
+                            try:
+                                new_node = Node(node_id, node_ip, node_port)
+                            except ValueError:
+                                continue  # e.g. port 0, seen in real traffic
+                            found_nodes[node_id] = new_node
+                            new_nodes.append(new_node)
+                        self.routing_table.add_nodes(new_nodes)
 
                 self._send_find_node(node.ip, node.port, target_id, find_callback)
 
@@ -268,9 +292,11 @@ class DHTClient:
         # Return closest nodes
         result = sorted(
             found_nodes.values(),
-            key=lambda n: distance(n.node_id, target_id)
+            key=lambda n: n._id_int ^ target_int
         )[:count]
 
+        self.lookup_cache.put(target_id, result)
+
         print(f"[DHT] Found {len(result)} nodes")
         return result
 
@@ -327,26 +353,25 @@ class DHTClient:
                     if b'values' in r:
                         values = r[b'values']
                         if isinstance(values, list):
-                            for peer_data in values:
-                                if len(peer_data) == 6:
-                                    ip_bytes = peer_data[:4]
-                                    port_bytes = peer_data[4:6]
-                                    ip = socket.inet_ntoa(ip_bytes)
-                                    port = int.from_bytes(port_bytes, 'big')
-                                    peers.add((ip, port))
+                            peers.update(unpack_peers(values))
 
                     # Check for closer nodes
                     if b'nodes' in r:
                         nodes_data = r[b'nodes']
                         try:
                             nodes = unpack_nodes(nodes_data)
-                            for node_id, node_ip, node_port in nodes:
-                                new_node = Node(node_id, node_ip, node_port)
-                                if node_id not in queried:
-                                    to_query.append(new_node)
-                                    self.routing_table.add_node(new_node)
                         except ValueError:
-                            pass
+                            return
+                        new_nodes = []
+                        for node_id, node_ip, node_port in nodes:
+                            if node_id in queried or node_id == self.node_id:
+                                continue
+                            try:
+                                new_nodes.append(Node(node_id, node_ip, node_port))
+                            except ValueError:
+                                continue  # e.g. port 0, seen in real traffic
+                        to_query.extend(new_nodes)
+                        self.routing_table.add_nodes(new_nodes)
 
                 self._send_get_peers(node.ip, node.port, info_hash, peer_callback)
 
@@ -626,8 +651,9 @@ class DHTClient:
                 if query_count % query_interval == 0:  # Every query_interval iterations
                     # Get some nodes from routing table
                     all_nodes = []
-                    for bucket in self.routing_table.buckets:
-                        all_nodes.extend(bucket)
+                    buckets = self.routing_table.buckets
+                    for index in self.routing_table.nonempty_buckets():
+                        all_nodes.extend(buckets[index])
 
                     if all_nodes:
                         # Pick random nodes to query
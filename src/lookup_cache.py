@@ -0,0 +1,205 @@
+"""
+Recent-lookup cache for Kademlia node lookups.
+
+An iterative lookup spends most of its time widening the candidate set until
+it converges on the K closest nodes to a target. When the same (or a nearby)
+target is looked up again shortly afterwards, the previous result is an
+excellent starting point: seeding the new lookup with it lets the search skip
+the early widening rounds.
+
+This module keeps a small LRU cache of the closest nodes observed for recently
+looked-up targets. Entries are keyed by the first 8 bytes (64 bits) of the
+target ID, so lookups for targets sharing that prefix share an entry; results
+are always re-ranked by XOR distance to the requested target before being
+returned.
+
+Reference: Kademlia Paper, Section 2.3 (node lookup)
+https://pdos.csail.mit.edu/~petar/papers/maymounkov-kademlia-lncs.pdf
+"""
+
+import threading
+from collections import OrderedDict
+from typing import List, Tuple
+
+from node import Node
+
+
+class RecentClosest:
+    """
+    LRU cache of the closest nodes seen for recently looked-up targets.
+
+    Each entry stores the target it was recorded for together with a list of
+    (distance, Node) pairs pre-sorted by XOR distance to that target.
+
+    Attributes:
+        max_entries (int): Maximum number of cached targets
+        k (int): Maximum number of nodes stored per target
+    """
+
+    # Number of leading target bytes used as the cache key (64 bits)
+    KEY_PREFIX_LEN = 8
+
+    def __init__(self, max_entries: int = 1024, k: int = 8):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached targets (default 1024)
+            k: Maximum number of nodes stored per target (default 8)
+
+        Raises:
+            ValueError: If max_entries or k is not positive or too large
+            TypeError: If arguments have wrong types
+
+        Examples:
+            >>> cache = RecentClosest()
+            >>> len(cache)
+            0
+
+        Security Notes:
+            - Bounds both the number of entries and nodes per entry to
+              prevent memory exhaustion
+        """
+        # Validate types
+        if not isinstance(max_entries, int):
+            raise TypeError(f"max_entries must be int, got {type(max_entries)}")
+        if not isinstance(k, int):
+            raise TypeError(f"k must be int, got {type(k)}")
+
+        # Validate ranges
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        if max_entries > 100000:  # Reasonable upper limit
+            raise ValueError(f"max_entries too large (max 100000), got {max_entries}")
+        if k <= 0:
+            raise ValueError(f"k must be positive, got {k}")
+        if k > 100:  # Same limit as RoutingTable
+            raise ValueError(f"k too large (max 100), got {k}")
+
+        self.max_entries = max_entries
+        self.k = k
+
+        # key prefix -> (target_int, [(distance, Node), ...] sorted by distance)
+        self._cache: 'OrderedDict[bytes, Tuple[int, List[Tuple[int, Node]]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached targets."""
+        return len(self._cache)
+
+    def put(self, target_id: bytes, nodes: List[Node]) -> None:
+        """
+        Record the closest nodes found by a completed lookup.
+
+        Only the k closest nodes are kept. Storing an empty list removes
+        any existing entry for the target's key.
+
+        Args:
+            target_id: The 20-byte target ID that was looked up
+            nodes: Nodes found by the lookup (any order)
+
+        Raises:
+            ValueError: If target_id is not 20 bytes
+            TypeError: If target_id is not bytes or nodes contains non-Node objects
+
+        Examples:
+            >>> cache = RecentClosest()
+            >>> cache.put(b'T' * 20, [Node(b'A' * 20, '192.168.1.1', 6881)])
+            >>> len(cache)
+            1
+        """
+        target_int = _target_as_int(target_id)
+
+        if not isinstance(nodes, list):
+            raise TypeError(f"nodes must be a list, got {type(nodes)}")
+        for node in nodes:
+            if not isinstance(node, Node):
+                raise TypeError(f"node must be Node object, got {type(node)}")
+
+        key = target_id[:self.KEY_PREFIX_LEN]
+
+        # Precompute distances once so the stored list is already ranked
+        entries = sorted(
+            ((node._id_int ^ target_int, node) for node in nodes),
+            key=lambda entry: entry[0]
+        )[:self.k]
+
+        with self._lock:
+            if not entries:
+                self._cache.pop(key, None)
+                return
+
+            self._cache[key] = (target_int, entries)
+            self._cache.move_to_end(key)
+
+            # Evict least recently used targets
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def get(self, target_id: bytes) -> List[Node]:
+        """
+        Get cached closest nodes for a target.
+
+        Args:
+            target_id: The 20-byte target ID about to be looked up
+
+        Returns:
+            List[Node]: Up to k cached nodes, sorted by XOR distance to
+            target_id (closest first); empty if nothing is cached
+
+        Raises:
+            ValueError: If target_id is not 20 bytes
+            TypeError: If target_id is not bytes
+
+        Examples:
+            >>> cache = RecentClosest()
+            >>> cache.get(b'T' * 20)
+            []
+        """
+        target_int = _target_as_int(target_id)
+        key = target_id[:self.KEY_PREFIX_LEN]
+
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is None:
+                return []
+            self._cache.move_to_end(key)
+
+        cached_target_int, entries = hit
+
+        # Same target: the stored order is already correct
+        if cached_target_int == target_int:
+            return [node for _, node in entries]
+
+        # Nearby target sharing the key prefix: re-rank for this target
+        return sorted(
+            (node for _, node in entries),
+            key=lambda node: node._id_int ^ target_int
+        )
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._cache.clear()
+
+
+def _target_as_int(target_id: bytes) -> int:
+    """
+    Validate a target ID and convert it to an integer.
+
+    Args:
+        target_id: The 20-byte target ID
+
+    Returns:
+        int: The target ID as a big-endian integer
+
+    Raises:
+        ValueError: If target_id is not 20 bytes
+        TypeError: If target_id is not bytes
+    """
+    if not isinstance(target_id, bytes):
+        raise TypeError(f"target_id must be bytes, got {type(target_id)}")
+    if len(target_id) != 20:
+        raise ValueError(f"target_id must be 20 bytes, got {len(target_id)} bytes")
+
+    return int.from_bytes(target_id, byteorder='big')
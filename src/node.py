@@ -15,9 +15,11 @@ https://www.bittorrent.org/beps/bep_0005.html
 import os
 import hashlib
 import socket
-from typing import Tuple
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple, Union
 
 
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class Node:
     """
     Represents a node in the DHT network.
@@ -30,15 +32,28 @@ class Node:
     The node ID is used by the Kademlia algorithm to determine proximity between
     nodes and to route queries efficiently across the distributed hash table.
 
+    Nodes are immutable: the class is a frozen dataclass with __slots__, so
+    instances carry no per-instance __dict__ and their hash can never go
+    stale while they sit in sets, dicts, or routing table buckets.
+
     Attributes:
         node_id (bytes): 20-byte node identifier
         ip (str): IP address (IPv4 or IPv6)
         port (int): UDP port number (1-65535)
+        _id_int (int): node_id as a big-endian integer, cached so XOR distance
+            and hashing work on a single integer instead of re-parsing bytes
     """
 
-    def __init__(self, node_id: bytes, ip: str, port: int):
+    node_id: bytes
+    ip: str
+    port: int
+    _id_int: int = field(init=False, repr=False)
+
+    def __post_init__(self):
         """
-        Initialize a DHT node.
+        Validate a newly constructed DHT node.
+
+        Called by the generated __init__(node_id, ip, port).
 
         Args:
             node_id: 20-byte node identifier (must be exactly 20 bytes)
@@ -65,18 +80,24 @@ class Node:
             - Validates IP address format to prevent injection
             - Validates port range to prevent invalid network operations
         """
+        node_id, ip, port = self.node_id, self.ip, self.port
+
+        # Validate node_id: a single combined check on the common path, with
+        # the specific error worked out only once it has failed.
+        # type() is used instead of isinstance() since IDs are always plain bytes.
+        if type(node_id) is not bytes or len(node_id) != 20:
+            if not isinstance(node_id, bytes):
+                raise TypeError(f"node_id must be bytes, got {type(node_id)}")
+            # Must be exactly 20 bytes for a 160-bit ID
+            if len(node_id) != 20:
+                raise ValueError(f"node_id must be 20 bytes, got {len(node_id)} bytes")
+
         # Validate types
-        if not isinstance(node_id, bytes):
-            raise TypeError(f"node_id must be bytes, got {type(node_id)}")
         if not isinstance(ip, str):
             raise TypeError(f"ip must be str, got {type(ip)}")
         if not isinstance(port, int):
             raise TypeError(f"port must be int, got {type(port)}")
 
-        # Validate node_id length (must be exactly 20 bytes for 160-bit ID)
-        if len(node_id) != 20:
-            raise ValueError(f"node_id must be 20 bytes, got {len(node_id)} bytes")
-
         # Validate IP address format
         # Try to parse as both IPv4 and IPv6
         try:
@@ -93,21 +114,50 @@ class Node:
         if not (1 <= port <= 65535):
             raise ValueError(f"Port must be in range 1-65535, got {port}")
 
-        self.node_id = node_id
-        self.ip = ip
-        self.port = port
+        # Frozen dataclass: derived fields must bypass the generated __setattr__
+        object.__setattr__(self, '_id_int', int.from_bytes(node_id, byteorder='big'))
+
+    def distance_to(self, other: 'Node') -> int:
+        """
+        Calculate XOR distance between this node and another node.
+
+        Uses the cached integer form of both node IDs, so no bytes are
+        converted on each call.
+
+        Args:
+            other: Another Node object
+
+        Returns:
+            int: XOR distance as an integer (0 to 2^160 - 1)
+
+        Raises:
+            TypeError: If other is not a Node object
+
+        Examples:
+            >>> node1 = Node(b'\\x00' * 20, '127.0.0.1', 6881)
+            >>> node2 = Node(b'\\x00' * 19 + b'\\x01', '127.0.0.1', 6882)
+            >>> node1.distance_to(node2)
+            1
+        """
+        if not isinstance(other, Node):
+            raise TypeError(f"other must be Node object, got {type(other)}")
+        return self._id_int ^ other._id_int
 
     def __eq__(self, other) -> bool:
         """
         Check equality between two nodes.
 
         Two nodes are considered equal if they have the same node_id, IP, and port.
+        Identity is checked first, then the cheap port compare, then the cached
+        integer ID, and the IP string last.
 
         Args:
             other: Another Node object to compare with
 
         Returns:
             bool: True if nodes are equal, False otherwise
+            NotImplemented: If other is not a Node (Python then falls back
+                to identity comparison, so the result is False)
 
         Examples:
             >>> node1 = Node(b'A' * 20, '127.0.0.1', 6881)
@@ -115,18 +165,21 @@ class Node:
             >>> node1 == node2
             True
         """
-        if not isinstance(other, Node):
-            return False
-        return (self.node_id == other.node_id and
-                self.ip == other.ip and
-                self.port == other.port)
+        if self is other:
+            return True
+        if type(other) is not Node:
+            return NotImplemented
+        return (self.port == other.port and
+                self._id_int == other._id_int and
+                self.ip == other.ip)
 
     def __hash__(self) -> int:
         """
         Generate hash for the node.
 
         Allows Node objects to be used in sets and as dictionary keys.
-        The hash is based on node_id, IP, and port.
+        The hash is based on the cached integer node_id; nodes that compare
+        equal always share a node_id, so they also share a hash.
 
         Returns:
             int: Hash value for the node
@@ -135,7 +188,7 @@ class Node:
             >>> node = Node(b'A' * 20, '127.0.0.1', 6881)
             >>> hash(node)  # Returns an integer
             """
-        return hash((self.node_id, self.ip, self.port))
+        return hash(self._id_int)
 
     def __repr__(self) -> str:
         """
@@ -154,7 +207,7 @@ class Node:
         return f"Node(id={node_id_hex}, ip={self.ip}, port={self.port})"
 
 
-def distance(node_id1: bytes, node_id2: bytes) -> int:
+def distance(node_id1: Union[bytes, Node], node_id2: Union[bytes, Node]) -> int:
     """
     Calculate XOR distance between two node IDs.
 
@@ -168,15 +221,15 @@ def distance(node_id1: bytes, node_id2: bytes) -> int:
     a binary tree where each bit represents a branch.
 
     Args:
-        node_id1: First 20-byte node ID
-        node_id2: Second 20-byte node ID
+        node_id1: First 20-byte node ID (or a Node, using its cached integer ID)
+        node_id2: Second 20-byte node ID (or a Node, using its cached integer ID)
 
     Returns:
         int: XOR distance as an integer (0 to 2^160 - 1)
 
     Raises:
         ValueError: If either node_id is not 20 bytes
-        TypeError: If arguments are not bytes
+        TypeError: If arguments are not bytes or Node objects
 
     Examples:
         >>> distance(b'\\x00' * 20, b'\\x00' * 20)
@@ -190,23 +243,37 @@ def distance(node_id1: bytes, node_id2: bytes) -> int:
         - Validates input lengths to prevent buffer overflows
         - Uses constant-time XOR operation (no timing attacks)
     """
-    # Validate types
-    if not isinstance(node_id1, bytes):
-        raise TypeError(f"node_id1 must be bytes, got {type(node_id1)}")
-    if not isinstance(node_id2, bytes):
-        raise TypeError(f"node_id2 must be bytes, got {type(node_id2)}")
+    return _id_as_int(node_id1, 'node_id1') ^ _id_as_int(node_id2, 'node_id2')
 
-    # Validate lengths
-    if len(node_id1) != 20:
-        raise ValueError(f"node_id1 must be 20 bytes, got {len(node_id1)} bytes")
-    if len(node_id2) != 20:
-        raise ValueError(f"node_id2 must be 20 bytes, got {len(node_id2)} bytes")
 
-    # Perform XOR byte-by-byte and convert to integer
-    # XOR each byte and combine into a single integer
-    xor_result = int.from_bytes(node_id1, byteorder='big') ^ int.from_bytes(node_id2, byteorder='big')
+def _id_as_int(node_id: Union[bytes, Node], name: str) -> int:
+    """
+    Convert a node ID (bytes or Node) to its integer form with validation.
 
-    return xor_result
+    Args:
+        node_id: 20-byte node ID or Node object
+        name: Argument name used in error messages
+
+    Returns:
+        int: The node ID as a big-endian integer
+
+    Raises:
+        ValueError: If node_id is bytes but not 20 bytes long
+        TypeError: If node_id is neither bytes nor a Node
+    """
+    # Nodes were validated on construction and carry a cached integer ID
+    if isinstance(node_id, Node):
+        return node_id._id_int
+
+    # Validate type
+    if not isinstance(node_id, bytes):
+        raise TypeError(f"{name} must be bytes, got {type(node_id)}")
+
+    # Validate length
+    if len(node_id) != 20:
+        raise ValueError(f"{name} must be 20 bytes, got {len(node_id)} bytes")
+
+    return int.from_bytes(node_id, byteorder='big')
 
 
 def generate_node_id() -> bytes:
@@ -238,3 +305,81 @@ def generate_node_id() -> bytes:
     # Use os.urandom for cryptographically secure random bytes
     # This is suitable for generating unique node IDs in a distributed system
     return os.urandom(20)
+
+
+def generate_node_ids(count: int) -> List[bytes]:
+    """
+    Generate several random 20-byte node IDs at once.
+
+    Draws all the randomness with a single os.urandom() call into one buffer
+    and slices it through a memoryview, instead of making one system call
+    and one small allocation per ID.
+
+    Args:
+        count: Number of node IDs to generate (0 to 1,000,000)
+
+    Returns:
+        List[bytes]: 'count' random 20-byte node IDs
+
+    Raises:
+        ValueError: If count is negative or too large
+        TypeError: If count is not an int
+
+    Examples:
+        >>> ids = generate_node_ids(3)
+        >>> len(ids)
+        3
+        >>> all(len(node_id) == 20 for node_id in ids)
+        True
+
+    Security Notes:
+        - Uses os.urandom() like generate_node_id()
+        - Limits count to prevent memory exhaustion
+    """
+    # Validate type
+    if not isinstance(count, int):
+        raise TypeError(f"count must be int, got {type(count)}")
+
+    # Validate range
+    if count < 0:
+        raise ValueError(f"count cannot be negative, got {count}")
+    if count > 1_000_000:  # Reasonable upper limit (20 MB of IDs)
+        raise ValueError(f"count too large (max 1000000), got {count}")
+
+    # One buffer for all IDs; only the final bytes() copies allocate
+    buffer = memoryview(os.urandom(20 * count))
+    return [bytes(buffer[offset:offset + 20]) for offset in range(0, 20 * count, 20)]
+
+
+def unique_ids(ids: Iterable[bytes]) -> List[bytes]:
+    """
+    Deduplicate a collection of node IDs.
+
+    Returns the distinct IDs in sorted order. Deduplication and sorting both
+    run in C (set construction and list.sort), which keeps this fast for
+    large batches of generated IDs such as keyspace-exploration runs.
+
+    Args:
+        ids: Iterable of 20-byte node IDs
+
+    Returns:
+        List[bytes]: Distinct node IDs, sorted in ascending order
+
+    Raises:
+        ValueError: If any ID is not 20 bytes
+        TypeError: If any ID is not bytes
+
+    Examples:
+        >>> unique_ids([b'B' * 20, b'A' * 20, b'B' * 20])
+        [b'AAAAAAAAAAAAAAAAAAAA', b'BBBBBBBBBBBBBBBBBBBB']
+    """
+    distinct = set(ids)
+
+    # Validate once per distinct ID rather than once per input element
+    for node_id in distinct:
+        if not isinstance(node_id, bytes):
+            raise TypeError(f"node_id must be bytes, got {type(node_id)}")
+        if len(node_id) != 20:
+            raise ValueError(f"node_id must be 20 bytes, got {len(node_id)} bytes")
+
+    return sorted(distinct)
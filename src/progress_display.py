@@ -11,6 +11,19 @@ Functions:
     clear_progress_line: Get ANSI code to clear current line
 """
 
+from functools import lru_cache
+
+
+# Parameter names of format_progress_line, in argument order
+_PROGRESS_FIELDS = ('elapsed', 'count', 'rate', 'total_requests', 'table_size')
+
+# Error message for every non-zero bitmask of negative parameters, keyed by
+# the mask and naming the lowest-numbered (first) negative parameter
+_NEGATIVE_MESSAGES = {
+    mask: f"{_PROGRESS_FIELDS[(mask & -mask).bit_length() - 1]} cannot be negative"
+    for mask in range(1, 1 << len(_PROGRESS_FIELDS))
+}
+
 
 def format_elapsed_time(seconds: float) -> str:
     """
@@ -34,13 +47,27 @@ def format_elapsed_time(seconds: float) -> str:
     if seconds < 0:
         raise ValueError("seconds cannot be negative")
 
-    # Convert to integer seconds
-    total_seconds = int(seconds)
+    # Convert to integer seconds and format via the memoized helper
+    return _format_whole_seconds(int(seconds))
+
+
+@lru_cache(maxsize=256)
+def _format_whole_seconds(total_seconds: int) -> str:
+    """
+    Format a non-negative whole number of seconds as HH:MM:SS.
+
+    Memoized because the progress display ticks once per second and
+    re-formats the same elapsed value several times per tick.
+
+    Args:
+        total_seconds: Whole seconds (already validated as non-negative)
 
+    Returns:
+        str: Formatted time string (e.g., "01:23:45")
+    """
     # Calculate hours, minutes, seconds
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
 
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
@@ -107,17 +134,18 @@ def format_progress_line(
     Raises:
         ValueError: If any parameter is negative
     """
-    # Validate all parameters are non-negative
-    if elapsed < 0:
-        raise ValueError("elapsed cannot be negative")
-    if count < 0:
-        raise ValueError("count cannot be negative")
-    if rate < 0:
-        raise ValueError("rate cannot be negative")
-    if total_requests < 0:
-        raise ValueError("total_requests cannot be negative")
-    if table_size < 0:
-        raise ValueError("table_size cannot be negative")
+    # Validate all parameters are non-negative with a single branch:
+    # each negative parameter sets one bit, and the lowest set bit picks
+    # the message (the first offending parameter in argument order)
+    bad = (
+        (elapsed < 0)
+        | (count < 0) << 1
+        | (rate < 0) << 2
+        | (total_requests < 0) << 3
+        | (table_size < 0) << 4
+    )
+    if bad:
+        raise ValueError(_NEGATIVE_MESSAGES[bad])
 
     # Format elapsed time
     time_str = format_elapsed_time(elapsed)
@@ -6,7 +6,7 @@ The routing table organizes known nodes into buckets based on their XOR distance
 the local node, allowing efficient routing of queries across the network.
 
 Key concepts:
-- K-buckets: Lists of nodes at specific distance ranges
+- K-buckets: Queues of nodes at specific distance ranges, least recently seen first
 - K value: Maximum nodes per bucket (typically 8 or 20)
 - 160 buckets: One for each bit position in the 160-bit node ID space
 - LRU eviction: Least Recently Used nodes are replaced when buckets are full
@@ -19,8 +19,10 @@ Maymounkov, P., & Mazières, D. (2002). Kademlia: A peer-to-peer information sys
 based on the XOR metric.
 """
 
-from typing import List, Optional
-from node import Node, distance
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from node import Node
 
 
 class RoutingTable:
@@ -36,9 +38,13 @@ class RoutingTable:
     Attributes:
         node_id (bytes): The local node's 20-byte ID
         k (int): Maximum nodes per bucket (Kademlia parameter K)
-        buckets (List[List[Node]]): 160 buckets, each containing up to K nodes
+        buckets (Tuple[Deque[Node], ...]): 160 buckets, each containing up to K nodes
+            (least recently seen first)
     """
 
+    # Maximum number of cached get_closest_nodes() results
+    CLOSEST_CACHE_SIZE = 128
+
     def __init__(self, node_id: bytes, k: int = 8):
         """
         Initialize the routing table.
@@ -82,8 +88,23 @@ class RoutingTable:
 
         self.node_id = node_id
         self.k = k
-        # Create 160 empty buckets (one for each bit in 160-bit ID space)
-        self.buckets: List[List[Node]] = [[] for _ in range(160)]
+        # Local ID as an integer, so bucket indices are one XOR + bit_length
+        self._node_int = int.from_bytes(node_id, byteorder='big')
+        # Create 160 empty buckets (one for each bit in 160-bit ID space).
+        # The outer tuple fixes the layout; the buckets themselves are mutable.
+        # Deques keep the least recently seen node at the head, so it can be
+        # taken with popleft() in O(1). No maxlen: appending to a full bucket
+        # must be refused (prefer old nodes), not silently evict the head.
+        self.buckets: Tuple[Deque[Node], ...] = tuple(deque() for _ in range(160))
+        # node_id -> (bucket index, Node) for O(1) membership checks
+        self._node_index: Dict[bytes, Tuple[int, Node]] = {}
+        # Bit i is set while bucket i holds at least one node
+        self._nonempty = 0
+        # (target_id, count) -> closest nodes, valid for the current _version.
+        # Any successful add/remove bumps _version and empties the cache.
+        self._closest_cache: 'OrderedDict[Tuple[bytes, int], Tuple[Node, ...]]' = OrderedDict()
+        self._version = 0
+        self._cache_lock = threading.Lock()
 
     def get_bucket_index(self, target_id: bytes) -> int:
         """
@@ -125,8 +146,23 @@ class RoutingTable:
         if len(target_id) != 20:
             raise ValueError(f"target_id must be 20 bytes, got {len(target_id)} bytes")
 
-        # Calculate XOR distance
-        dist = distance(self.node_id, target_id)
+        return self._bucket_index(int.from_bytes(target_id, byteorder='big'))
+
+    def _bucket_index(self, id_int: int) -> int:
+        """
+        Calculate the bucket index for an already-validated ID given as an integer.
+
+        Args:
+            id_int: The node ID as a big-endian integer
+
+        Returns:
+            int: Bucket index (0-159)
+
+        Raises:
+            ValueError: If id_int is the local node ID
+        """
+        # XOR distance to the local node
+        dist = self._node_int ^ id_int
 
         # Can't add self to routing table
         if dist == 0:
@@ -137,9 +173,7 @@ class RoutingTable:
         # bit_length() returns the number of bits needed to represent the number
         # bit_length() - 1 gives us the position of the MSB (0-indexed from right)
         # In Kademlia: bucket 0 = closest (LSB differs), bucket 159 = farthest (MSB differs)
-        bucket_index = dist.bit_length() - 1
-
-        return bucket_index
+        return dist.bit_length() - 1
 
     def add_node(self, node: Node) -> bool:
         """
@@ -153,7 +187,8 @@ class RoutingTable:
             node: The Node object to add
 
         Returns:
-            bool: True if node was added, False if bucket was full or node already exists
+            bool: True if node was added, False if bucket was full or the node ID
+            is already known
 
         Raises:
             TypeError: If node is not a Node object
@@ -173,6 +208,7 @@ class RoutingTable:
             - Prevents self-addition to avoid routing loops
             - Limits bucket size to prevent memory exhaustion
             - Checks for duplicates to prevent amplification attacks
+            - Keeps at most one entry per node ID
         """
         # Validate type
         if not isinstance(node, Node):
@@ -182,25 +218,47 @@ class RoutingTable:
         if node.node_id == self.node_id:
             raise ValueError("Cannot add own node to routing table")
 
-        # Determine which bucket this node belongs to
-        try:
-            bucket_index = self.get_bucket_index(node.node_id)
-        except ValueError as e:
-            # This happens if trying to add self
-            raise ValueError(f"Cannot add node: {e}")
+        # Determine which bucket this node belongs to (the Node already
+        # validated its ID and carries it as an integer; self was excluded above)
+        added = self._add_node_unchecked(node, self._bucket_index(node._id_int))
+        if added:
+            self._invalidate_closest()
+        return added
+
+    def _add_node_unchecked(self, node: Node, bucket_index: int) -> bool:
+        """
+        Insert a node into a known bucket without validating the arguments.
 
+        Callers must pass a Node other than the local node together with its
+        correct bucket index, and invalidate the closest-results cache if this
+        returns True.
+
+        Args:
+            node: The Node object to add
+            bucket_index: Bucket the node belongs to
+
+        Returns:
+            bool: True if node was added, False if bucket was full or the node ID
+            is already known
+        """
         bucket = self.buckets[bucket_index]
 
-        # Check if node already exists in bucket
-        if node in bucket:
-            # Node already in bucket, move to end (LRU update)
-            bucket.remove(node)
-            bucket.append(node)
+        # Check if a node with this ID is already known
+        known = self._node_index.get(node.node_id)
+        if known is not None:
+            if known[1] == node:
+                # Same node seen again, move to end (LRU update)
+                bucket.remove(node)
+                bucket.append(node)
+            # A different address for a known ID does not replace the
+            # existing entry (prefer old nodes, as for full buckets)
             return False
 
         # If bucket not full, add node to end
         if len(bucket) < self.k:
             bucket.append(node)
+            self._node_index[node.node_id] = (bucket_index, node)
+            self._nonempty |= 1 << bucket_index
             return True
 
         # Bucket is full - in full Kademlia implementation, we would ping
@@ -208,6 +266,57 @@ class RoutingTable:
         # For simplicity, we just don't add the new node (prefer old nodes)
         return False
 
+    def add_nodes(self, nodes: Iterable[Node]) -> int:
+        """
+        Add several nodes to the routing table in one pass.
+
+        Each node is handled as by add_node(), except that the local node ID
+        is skipped instead of raising, since node lists received from the
+        network may include it.
+
+        Args:
+            nodes: Iterable of Node objects to add
+
+        Returns:
+            int: Number of nodes that were added
+
+        Raises:
+            TypeError: If any element is not a Node object (nodes before it
+                remain added)
+
+        Examples:
+            >>> table = RoutingTable(b'A' * 20)
+            >>> table.add_nodes([
+            ...     Node(b'B' * 20, '192.168.1.1', 6881),
+            ...     Node(b'C' * 20, '192.168.1.2', 6881),
+            ...     Node(b'A' * 20, '192.168.1.3', 6881),  # Own ID, skipped
+            ... ])
+            2
+
+        Security Notes:
+            - Same bucket size limits and duplicate checks as add_node()
+        """
+        # Validation is done here once per node; the insert itself skips it
+        local_int = self._node_int
+        add_unchecked = self._add_node_unchecked
+        added = 0
+
+        try:
+            for node in nodes:
+                if not isinstance(node, Node):
+                    raise TypeError(f"node must be Node object, got {type(node)}")
+
+                dist = local_int ^ node._id_int
+                if dist and add_unchecked(node, dist.bit_length() - 1):
+                    added += 1
+        finally:
+            # Nodes inserted before a bad element stay, so cached lookups
+            # must be dropped even when the batch raises
+            if added:
+                self._invalidate_closest()
+
+        return added
+
     def remove_node(self, node: Node) -> bool:
         """
         Remove a node from the routing table.
@@ -238,29 +347,56 @@ class RoutingTable:
         if not isinstance(node, Node):
             raise TypeError(f"node must be Node object, got {type(node)}")
 
-        # Find the bucket
-        try:
-            bucket_index = self.get_bucket_index(node.node_id)
-        except ValueError:
-            # Node not in any bucket (possibly self)
+        # Look the node up by ID; it must also match the stored address
+        known = self._node_index.get(node.node_id)
+        if known is None or known[1] != node:
             return False
 
+        bucket_index, stored = known
+        del self._node_index[node.node_id]
         bucket = self.buckets[bucket_index]
+        bucket.remove(stored)
+        if not bucket:
+            self._nonempty &= ~(1 << bucket_index)
+        self._invalidate_closest()
+        return True
 
-        # Try to remove node from bucket
-        if node in bucket:
-            bucket.remove(node)
-            return True
+    def nonempty_buckets(self) -> Iterator[int]:
+        """
+        Iterate over the indices of buckets that hold at least one node.
 
-        return False
+        Uses a 160-bit occupancy bitmap, so empty buckets cost nothing.
+
+        Returns:
+            Iterator[int]: Bucket indices in ascending order
+
+        Examples:
+            >>> table = RoutingTable(b'\\x00' * 20)
+            >>> table.add_node(Node(b'\\x00' * 19 + b'\\x01', '192.168.1.1', 6881))
+            True
+            >>> list(table.nonempty_buckets())
+            [0]
+        """
+        remaining = self._nonempty
+        while remaining:
+            lowest = remaining & -remaining
+            yield lowest.bit_length() - 1
+            remaining ^= lowest
+
+    def _invalidate_closest(self) -> None:
+        """Discard cached closest-node results after the table changed."""
+        with self._cache_lock:
+            self._version += 1
+            self._closest_cache.clear()
 
     def get_closest_nodes(self, target_id: bytes, count: int = 8) -> List[Node]:
         """
         Get the K closest nodes to a target ID.
 
-        Searches across all buckets to find nodes closest to the target,
-        sorted by XOR distance. This is used for iterative lookups in the
-        Kademlia protocol.
+        Walks the buckets outward from the target's bucket, stopping as soon
+        as the remaining buckets can only hold farther nodes, and returns the
+        candidates sorted by XOR distance. This is used for iterative lookups
+        in the Kademlia protocol.
 
         Args:
             target_id: The 20-byte target node ID
@@ -290,6 +426,8 @@ class RoutingTable:
             - Validates inputs to prevent invalid operations
             - Limits result count to prevent resource exhaustion
             - Returns sorted results for consistent behavior
+            - Caches at most CLOSEST_CACHE_SIZE results, discarded whenever
+              the table changes
         """
         # Validate types
         if not isinstance(target_id, bytes):
@@ -307,24 +445,62 @@ class RoutingTable:
         if count > 1000:  # Reasonable upper limit
             raise ValueError(f"count too large (max 1000), got {count}")
 
-        # Collect all nodes from all buckets
+        # Repeated lookups for the same target reuse the previous result
+        # until the table changes
+        key = (target_id, count)
+        with self._cache_lock:
+            hit = self._closest_cache.get(key)
+            if hit is not None:
+                self._closest_cache.move_to_end(key)
+                return list(hit)
+            version = self._version
+
+        # Walk the buckets in order of distance to the target instead of
+        # collecting the whole table. With j the MSB of (local XOR target),
+        # a node in bucket i is at distance:
+        #   i == j: below 2**j
+        #   i <  j: in [2**j, 2**(j+1))
+        #   i >  j: in [2**i, 2**(i+1))
+        # so bucket j, then buckets 0..j-1 together, then j+1, j+2, ... form
+        # groups of strictly increasing distance. Once the groups collected so
+        # far hold `count` nodes, no later bucket can contain a closer one.
+        buckets = self.buckets
+        target_int = int.from_bytes(target_id, byteorder='big')
+        target_bucket = (self._node_int ^ target_int).bit_length() - 1
+
+        # Empty buckets are skipped using the occupancy bitmap
+        nonempty = self._nonempty
         all_nodes: List[Node] = []
-        for bucket in self.buckets:
-            all_nodes.extend(bucket)
-
-        # If no nodes, return empty list
-        if not all_nodes:
-            return []
-
-        # Sort nodes by distance to target
-        # Calculate distance for each node and sort
-        nodes_with_distance = [
-            (node, distance(node.node_id, target_id))
-            for node in all_nodes
-        ]
-        nodes_with_distance.sort(key=lambda x: x[1])
+        if target_bucket >= 0:  # -1 when the target is the local ID
+            all_nodes.extend(buckets[target_bucket])
+            if len(all_nodes) < count:
+                lower = nonempty & ((1 << target_bucket) - 1)
+                while lower:
+                    lowest = lower & -lower
+                    all_nodes.extend(buckets[lowest.bit_length() - 1])
+                    lower ^= lowest
+
+        higher = nonempty >> (target_bucket + 1) << (target_bucket + 1)
+        while higher and len(all_nodes) < count:
+            lowest = higher & -higher
+            all_nodes.extend(buckets[lowest.bit_length() - 1])
+            higher ^= lowest
+
+        # Sort the candidates by distance to target. Each Node carries its ID
+        # as an integer, so the key is a single XOR with no bytes parsing.
+        # The walk leaves only about `count` candidates; at these sizes a full
+        # sort and slice measured faster than heapq.nsmallest (which only pays
+        # off beyond ~150 items).
+        all_nodes.sort(key=lambda node: node._id_int ^ target_int)
 
         # Return up to 'count' closest nodes
-        closest_nodes = [node for node, dist in nodes_with_distance[:count]]
+        closest_nodes = all_nodes[:count]
+
+        # Only cache if the table did not change while we were computing
+        with self._cache_lock:
+            if version == self._version:
+                self._closest_cache[key] = tuple(closest_nodes)
+                if len(self._closest_cache) > self.CLOSEST_CACHE_SIZE:
+                    self._closest_cache.popitem(last=False)
 
         return closest_nodes
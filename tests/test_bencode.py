@@ -10,7 +10,9 @@ import sys
 import os
 
 # Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_DIR not in sys.path:  # Only once when several test modules are loaded
+    sys.path.insert(0, SRC_DIR)
 
 from bencode import encode, decode
 
@@ -345,6 +347,24 @@ class TestBencodeRoundTrip(unittest.TestCase):
             decoded, _ = decode(encoded)
             self.assertEqual(decoded, val)
 
+    def test_roundtrip_large_nested(self):
+        """Test roundtrip of a large nested structure (DHT-response sized)."""
+        value = {
+            b'r': {
+                b'id': b'A' * 20,
+                b'nodes': b'N' * 26 * 8,
+                b'values': [b'P' * 6 for _ in range(200)],
+            },
+            b't': b'aa',
+            b'y': b'r',
+        }
+
+        encoded = encode(value)
+        decoded, consumed = decode(encoded)
+
+        self.assertEqual(decoded, value)
+        self.assertEqual(consumed, len(encoded))
+
 
 if __name__ == '__main__':
     # Run tests with verbose output
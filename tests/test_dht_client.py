@@ -8,11 +8,16 @@ Network I/O is tested separately.
 import unittest
 import sys
 import os
+import socket
+import struct
 
 # Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_DIR not in sys.path:  # Only once when several test modules are loaded
+    sys.path.insert(0, SRC_DIR)
 
 from dht_client import DHTClient
+from node import Node
 
 
 class TestDHTClientInit(unittest.TestCase):
@@ -77,6 +82,13 @@ class TestDHTClientInit(unittest.TestCase):
         self.assertEqual(client.routing_table.node_id, node_id)
         self.assertEqual(client.routing_table.k, 8)
 
+    def test_lookup_cache_created(self):
+        """Test that the recent-lookup cache starts empty."""
+        client = DHTClient()
+
+        self.assertEqual(len(client.lookup_cache), 0)
+        self.assertEqual(client.lookup_cache.k, 8)
+
     def test_pending_queries_empty(self):
         """Test that pending queries starts empty."""
         client = DHTClient()
@@ -259,6 +271,72 @@ class TestCrawlNetworkQueryInterval(unittest.TestCase):
             client.stop()
 
 
+class TestNodesResponseHandling(unittest.TestCase):
+    """Test cases for find_node responses containing malformed entries."""
+
+    def setUp(self):
+        """Build a nodes blob with four valid records and one port-0 record."""
+        self.valid_ids = [bytes([i]) * 20 for i in range(1, 5)]
+        records = [
+            struct.pack('!20s4sH', node_id, socket.inet_aton('10.0.0.1'), 6881)
+            for node_id in self.valid_ids
+        ]
+        records.append(struct.pack('!20s4sH', b'\x09' * 20,
+                                   socket.inet_aton('10.0.0.2'), 0))
+        self.response = {b'y': b'r', b'r': {b'id': b'R' * 20, b'nodes': b''.join(records)}}
+
+        self.client = DHTClient(node_id=b'\xff' * 20)
+
+        # Answer every find_node query immediately instead of using the network
+        def send_find_node(ip, port, target_id, callback):
+            callback(self.response, (ip, port))
+        self.client._send_find_node = send_find_node
+
+    def assert_valid_nodes_in_table(self):
+        """Check that every valid record reached the routing table."""
+        table = self.client.routing_table
+        for node_id in self.valid_ids:
+            bucket = table.buckets[table.get_bucket_index(node_id)]
+            self.assertIn(node_id, [node.node_id for node in bucket])
+
+    def test_bootstrap_skips_invalid_entries(self):
+        """Test that a port-0 record does not discard the rest of a bootstrap response."""
+        self.client.running = True  # No socket needed with the stubbed sender
+
+        self.assertTrue(self.client.bootstrap([('127.0.0.1', 6881)]))
+
+        self.assert_valid_nodes_in_table()
+
+    def test_find_node_skips_invalid_entries(self):
+        """Test that a port-0 record does not keep valid nodes out of the table."""
+        self.client.routing_table.add_node(Node(b'\x0a' * 20, '10.0.0.3', 6881))
+
+        result = self.client.find_node(b'\x00' * 20)
+
+        self.assert_valid_nodes_in_table()
+        self.assertNotIn(b'\x09' * 20, [node.node_id for node in result])
+
+    def test_get_peers_skips_invalid_entries(self):
+        """Test that port-0 and own-ID records do not drop the rest of a get_peers response."""
+        own_record = struct.pack('!20s4sH', self.client.node_id,
+                                 socket.inet_aton('10.0.0.4'), 6881)
+        nodes = self.response[b'r'][b'nodes']
+        self.response[b'r'][b'nodes'] = own_record + nodes
+        self.client.routing_table.add_node(Node(b'\x0a' * 20, '10.0.0.3', 6881))
+
+        # Only the first queried node returns nodes; later ones return none
+        responses = [self.response]
+
+        def send_get_peers(ip, port, info_hash, callback):
+            if responses:
+                callback(responses.pop(), (ip, port))
+        self.client._send_get_peers = send_get_peers
+
+        self.assertEqual(self.client.get_peers(b'\x00' * 20, timeout=5.0), [])
+
+        self.assert_valid_nodes_in_table()
+
+
 if __name__ == '__main__':
     # Run tests with verbose output
     unittest.main(verbosity=2)
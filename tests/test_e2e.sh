@@ -153,6 +153,7 @@ TEST_FILES=(
     "tests/test_protocol.py"
     "tests/test_dht_client.py"
     "tests/test_progress_display.py"
+    "tests/test_lookup_cache.py"
 )
 
 ALL_TESTS_FOUND=true
@@ -164,7 +165,7 @@ for test_file in "${TEST_FILES[@]}"; do
 done
 
 if $ALL_TESTS_FOUND; then
-    pass "All 6 unit test files exist"
+    pass "All 7 unit test files exist"
 else
     fail "Some unit test files are missing"
 fi
@@ -221,6 +222,7 @@ SOURCE_FILES=(
     "src/protocol.py"
     "src/dht_client.py"
     "src/progress_display.py"
+    "src/lookup_cache.py"
 )
 
 ALL_SOURCES_FOUND=true
@@ -232,7 +234,7 @@ for source_file in "${SOURCE_FILES[@]}"; do
 done
 
 if $ALL_SOURCES_FOUND; then
-    pass "All 6 source modules exist"
+    pass "All 7 source modules exist"
 else
     fail "Some source modules are missing"
 fi
@@ -0,0 +1,144 @@
+"""
+Unit tests for the recent-lookup cache module.
+
+This test suite validates the RecentClosest LRU cache used to seed
+repeat node lookups.
+"""
+
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_DIR not in sys.path:  # Only once when several test modules are loaded
+    sys.path.insert(0, SRC_DIR)
+
+from lookup_cache import RecentClosest
+from node import Node, distance
+
+
+class TestRecentClosestInit(unittest.TestCase):
+    """Test cases for RecentClosest initialization."""
+
+    def test_init_defaults(self):
+        """Test creating cache with default parameters."""
+        cache = RecentClosest()
+
+        self.assertEqual(cache.max_entries, 1024)
+        self.assertEqual(cache.k, 8)
+        self.assertEqual(len(cache), 0)
+
+    def test_init_invalid_values(self):
+        """Test that invalid sizes raise ValueError."""
+        with self.assertRaises(ValueError) as ctx:
+            RecentClosest(max_entries=0)
+        self.assertIn("positive", str(ctx.exception))
+
+        with self.assertRaises(ValueError):
+            RecentClosest(k=0)
+
+        with self.assertRaises(ValueError) as ctx:
+            RecentClosest(k=101)
+        self.assertIn("too large", str(ctx.exception))
+
+    def test_init_invalid_types(self):
+        """Test that invalid types raise TypeError."""
+        with self.assertRaises(TypeError):
+            RecentClosest(max_entries='10')
+
+        with self.assertRaises(TypeError):
+            RecentClosest(k=8.0)
+
+
+class TestRecentClosestPutGet(unittest.TestCase):
+    """Test cases for storing and retrieving cached lookups."""
+
+    def setUp(self):
+        """Create a cache and a few nodes at known distances."""
+        self.cache = RecentClosest(k=3)
+        self.target = b'\x00' * 20
+        self.nodes = [
+            Node(b'\x00' * 19 + bytes([i]), '192.168.1.1', 6881 + i)
+            for i in (5, 1, 9, 3)
+        ]
+
+    def test_get_empty(self):
+        """Test that an unknown target returns an empty list."""
+        self.assertEqual(self.cache.get(self.target), [])
+
+    def test_put_get_sorted_and_limited(self):
+        """Test that results are sorted by distance and limited to k."""
+        self.cache.put(self.target, self.nodes)
+
+        result = self.cache.get(self.target)
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual([n.node_id[-1] for n in result], [1, 3, 5])
+
+    def test_get_nearby_target_reranked(self):
+        """Test that a target sharing the key prefix is re-ranked."""
+        self.cache.put(self.target, self.nodes)
+        nearby = b'\x00' * 19 + b'\x05'
+
+        result = self.cache.get(nearby)
+
+        distances = [distance(n.node_id, nearby) for n in result]
+        self.assertEqual(distances, sorted(distances))
+        self.assertEqual(result[0].node_id, nearby)
+
+    def test_put_empty_removes_entry(self):
+        """Test that storing an empty result removes the entry."""
+        self.cache.put(self.target, self.nodes)
+        self.cache.put(self.target, [])
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.get(self.target), [])
+
+    def test_lru_eviction(self):
+        """Test that the least recently used target is evicted."""
+        cache = RecentClosest(max_entries=2)
+        target_a = b'A' * 20
+        target_b = b'B' * 20
+        target_c = b'C' * 20
+
+        cache.put(target_a, self.nodes)
+        cache.put(target_b, self.nodes)
+        cache.get(target_a)  # Touch A so B becomes least recently used
+        cache.put(target_c, self.nodes)
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotEqual(cache.get(target_a), [])
+        self.assertEqual(cache.get(target_b), [])
+        self.assertNotEqual(cache.get(target_c), [])
+
+    def test_clear(self):
+        """Test that clear removes all entries."""
+        self.cache.put(self.target, self.nodes)
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalid_target(self):
+        """Test that invalid target IDs raise errors."""
+        with self.assertRaises(ValueError) as ctx:
+            self.cache.get(b'short')
+        self.assertIn("20 bytes", str(ctx.exception))
+
+        with self.assertRaises(TypeError) as ctx:
+            self.cache.put('not bytes', self.nodes)
+        self.assertIn("target_id must be bytes", str(ctx.exception))
+
+    def test_put_invalid_nodes(self):
+        """Test that non-Node entries raise TypeError."""
+        with self.assertRaises(TypeError) as ctx:
+            self.cache.put(self.target, [b'A' * 20])
+        self.assertIn("Node object", str(ctx.exception))
+
+        with self.assertRaises(TypeError):
+            self.cache.put(self.target, 'not a list')
+
+
+if __name__ == '__main__':
+    # Run tests with verbose output
+    unittest.main(verbosity=2)
@@ -10,9 +10,11 @@ import sys
 import os
 
 # Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_DIR not in sys.path:  # Only once when several test modules are loaded
+    sys.path.insert(0, SRC_DIR)
 
-from node import Node, distance, generate_node_id
+from node import Node, distance, generate_node_id, generate_node_ids, unique_ids
 
 
 class TestNodeInit(unittest.TestCase):
@@ -75,6 +77,17 @@ class TestNodeInit(unittest.TestCase):
         with self.assertRaises(TypeError):
             Node(12345, '127.0.0.1', 6881)
 
+    def test_node_creation_bytes_subclass_node_id(self):
+        """Test that a 20-byte bytes subclass is still accepted as node_id."""
+        class NodeId(bytes):
+            pass
+
+        node = Node(NodeId(b'A' * 20), '127.0.0.1', 6881)
+        self.assertEqual(node.node_id, b'A' * 20)
+
+        with self.assertRaises(ValueError):
+            Node(NodeId(b'short'), '127.0.0.1', 6881)
+
     def test_node_creation_invalid_ip(self):
         """Test that invalid IP address raises ValueError."""
         node_id = b'A' * 20
@@ -143,6 +156,27 @@ class TestNodeInit(unittest.TestCase):
         node2 = Node(node_id, ip, 65535)
         self.assertEqual(node2.port, 65535)
 
+    def test_node_is_immutable(self):
+        """Test that node fields cannot be reassigned after creation."""
+        node = Node(b'A' * 20, '127.0.0.1', 6881)
+
+        with self.assertRaises(AttributeError):
+            node.port = 6882
+        with self.assertRaises(AttributeError):
+            node.node_id = b'B' * 20
+
+        self.assertEqual(node.port, 6881)
+        self.assertEqual(node.node_id, b'A' * 20)
+
+    def test_node_uses_slots(self):
+        """Test that nodes store their fields in slots, not a per-instance dict."""
+        node = Node(b'A' * 20, '127.0.0.1', 6881)
+
+        self.assertEqual(set(Node.__slots__), {'node_id', 'ip', 'port', '_id_int'})
+        self.assertFalse(hasattr(node, '__dict__'))
+        with self.assertRaises((AttributeError, TypeError)):
+            node.extra = 'not allowed'
+
 
 class TestNodeEquality(unittest.TestCase):
     """Test cases for Node equality comparison."""
@@ -193,6 +227,13 @@ class TestNodeEquality(unittest.TestCase):
         self.assertNotEqual(node, None)
         self.assertFalse(node == "not a node")
 
+    def test_node_equality_same_object(self):
+        """Test that a node is equal to itself."""
+        node = Node(b'A' * 20, '127.0.0.1', 6881)
+
+        self.assertTrue(node == node)
+        self.assertFalse(node != node)
+
 
 class TestNodeHash(unittest.TestCase):
     """Test cases for Node hashing."""
@@ -346,6 +387,36 @@ class TestDistance(unittest.TestCase):
         self.assertIsInstance(d_23, int)
         self.assertIsInstance(d_13, int)
 
+    def test_distance_accepts_nodes(self):
+        """Test that distance accepts Node objects as well as bytes."""
+        node1 = Node(b'\x00' * 20, '127.0.0.1', 6881)
+        node2 = Node(b'\xff' * 20, '127.0.0.1', 6882)
+
+        expected = distance(b'\x00' * 20, b'\xff' * 20)
+        self.assertEqual(distance(node1, node2), expected)
+        self.assertEqual(distance(node1, b'\xff' * 20), expected)
+        self.assertEqual(distance(b'\x00' * 20, node2), expected)
+
+
+class TestNodeDistanceTo(unittest.TestCase):
+    """Test cases for Node.distance_to."""
+
+    def test_distance_to_matches_distance(self):
+        """Test that distance_to agrees with the distance function."""
+        node1 = Node(b'A' * 20, '127.0.0.1', 6881)
+        node2 = Node(b'B' * 20, '127.0.0.1', 6882)
+
+        self.assertEqual(node1.distance_to(node2), distance(b'A' * 20, b'B' * 20))
+        self.assertEqual(node1.distance_to(node1), 0)
+
+    def test_distance_to_invalid_type(self):
+        """Test that distance_to rejects non-Node arguments."""
+        node = Node(b'A' * 20, '127.0.0.1', 6881)
+
+        with self.assertRaises(TypeError) as ctx:
+            node.distance_to(b'B' * 20)
+        self.assertIn("Node object", str(ctx.exception))
+
 
 class TestGenerateNodeId(unittest.TestCase):
     """Test cases for node ID generation."""
@@ -366,8 +437,7 @@ class TestGenerateNodeId(unittest.TestCase):
         ids = [generate_node_id() for _ in range(100)]
 
         # All should be different (collision probability is negligible)
-        unique_ids = set(ids)
-        self.assertEqual(len(unique_ids), 100)
+        self.assertEqual(len(unique_ids(ids)), 100)
 
     def test_generate_node_id_randomness(self):
         """Test that generated IDs have sufficient randomness."""
@@ -391,6 +461,74 @@ class TestGenerateNodeId(unittest.TestCase):
         self.assertEqual(node.node_id, node_id)
 
 
+class TestGenerateNodeIds(unittest.TestCase):
+    """Test cases for bulk node ID generation."""
+
+    def test_generate_node_ids_count_and_length(self):
+        """Test that the requested number of 20-byte IDs is returned."""
+        ids = generate_node_ids(100)
+
+        self.assertEqual(len(ids), 100)
+        for node_id in ids:
+            self.assertIsInstance(node_id, bytes)
+            self.assertEqual(len(node_id), 20)
+
+    def test_generate_node_ids_unique(self):
+        """Test that bulk-generated IDs are unique (probabilistically)."""
+        ids = generate_node_ids(100)
+        self.assertEqual(len(unique_ids(ids)), 100)
+
+    def test_generate_node_ids_zero(self):
+        """Test that zero IDs gives an empty list."""
+        self.assertEqual(generate_node_ids(0), [])
+
+    def test_generate_node_ids_can_create_node(self):
+        """Test that bulk-generated IDs can be used to create Nodes."""
+        node_id = generate_node_ids(1)[0]
+
+        node = Node(node_id, '127.0.0.1', 6881)
+        self.assertEqual(node.node_id, node_id)
+
+    def test_generate_node_ids_invalid_count(self):
+        """Test that invalid counts raise errors."""
+        with self.assertRaises(ValueError) as ctx:
+            generate_node_ids(-1)
+        self.assertIn("negative", str(ctx.exception))
+
+        with self.assertRaises(ValueError):
+            generate_node_ids(1_000_001)
+
+        with self.assertRaises(TypeError):
+            generate_node_ids('10')
+
+
+class TestUniqueIds(unittest.TestCase):
+    """Test cases for node ID deduplication."""
+
+    def test_unique_ids_removes_duplicates(self):
+        """Test that duplicates are removed and result is sorted."""
+        ids = [b'C' * 20, b'A' * 20, b'C' * 20, b'B' * 20, b'A' * 20]
+
+        result = unique_ids(ids)
+
+        self.assertEqual(result, [b'A' * 20, b'B' * 20, b'C' * 20])
+
+    def test_unique_ids_empty(self):
+        """Test that an empty input gives an empty list."""
+        self.assertEqual(unique_ids([]), [])
+
+    def test_unique_ids_invalid_length(self):
+        """Test that IDs of the wrong length raise ValueError."""
+        with self.assertRaises(ValueError) as ctx:
+            unique_ids([b'A' * 20, b'short'])
+        self.assertIn("20 bytes", str(ctx.exception))
+
+    def test_unique_ids_invalid_type(self):
+        """Test that non-bytes IDs raise TypeError."""
+        with self.assertRaises(TypeError):
+            unique_ids(['A' * 20])
+
+
 if __name__ == '__main__':
     # Run tests with verbose output
     unittest.main(verbosity=2)
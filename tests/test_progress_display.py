@@ -11,7 +11,9 @@ import sys
 import os
 
 # Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_DIR not in sys.path:  # Only once when several test modules are loaded
+    sys.path.insert(0, SRC_DIR)
 
 from progress_display import (
     format_elapsed_time,
@@ -51,6 +53,16 @@ class TestFormatElapsedTime(unittest.TestCase):
         result = format_elapsed_time(91815.0)
         self.assertEqual(result, "25:30:15")
 
+    def test_format_repeated_calls_same_second(self):
+        """Test that values within the same second format identically."""
+        first = format_elapsed_time(125.1)
+        second = format_elapsed_time(125.9)
+        third = format_elapsed_time(125)
+
+        self.assertEqual(first, "00:02:05")
+        self.assertEqual(second, first)
+        self.assertEqual(third, first)
+
     def test_format_negative_time_raises_error(self):
         """Test that negative time raises ValueError."""
         with self.assertRaises(ValueError) as context:
@@ -178,6 +190,16 @@ class TestFormatProgressLine(unittest.TestCase):
         with self.assertRaises(ValueError):
             format_progress_line(10.0, 10, 5.0, 100, -50)
 
+    def test_format_progress_line_negative_error_names_first_field(self):
+        """Test that the error names the first negative parameter."""
+        with self.assertRaises(ValueError) as context:
+            format_progress_line(10.0, -10, 5.0, 100, -50)
+        self.assertEqual(str(context.exception), "count cannot be negative")
+
+        with self.assertRaises(ValueError) as context:
+            format_progress_line(10.0, 10, 5.0, 100, -50)
+        self.assertEqual(str(context.exception), "table_size cannot be negative")
+
 
 class TestClearProgressLine(unittest.TestCase):
     """Test the clear_progress_line function."""
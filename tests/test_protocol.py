@@ -9,14 +9,22 @@ import sys
 import os
 
 # Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_DIR not in sys.path:  # Only once when several test modules are loaded
+    sys.path.insert(0, SRC_DIR)
 
+from bencode import encode
 from protocol import (
     create_ping_query,
     create_find_node_query,
     create_get_peers_query,
     pack_nodes,
     unpack_nodes,
+    pack_nodes_columns,
+    unpack_nodes_columns,
+    unpack_peers,
+    pack_samples,
+    unpack_samples,
     parse_message
 )
 
@@ -48,6 +56,15 @@ class TestCreatePingQuery(unittest.TestCase):
         self.assertEqual(parsed[b't'], transaction_id)
         self.assertEqual(parsed[b'a'][b'id'], node_id)
 
+    def test_create_ping_query_matches_bencode(self):
+        """Test that the ping query is identical to bencoding the dict."""
+        expected = encode({
+            b't': b'aa', b'y': b'q', b'q': b'ping',
+            b'a': {b'id': b'A' * 20}
+        })
+
+        self.assertEqual(create_ping_query(b'aa', b'A' * 20), expected)
+
     def test_create_ping_query_invalid_transaction_id_length(self):
         """Test that invalid transaction ID length raises ValueError."""
         with self.assertRaises(ValueError) as ctx:
@@ -71,6 +88,12 @@ class TestCreatePingQuery(unittest.TestCase):
         with self.assertRaises(TypeError):
             create_ping_query(b'aa', 'A' * 20)  # str instead of bytes
 
+    def test_create_ping_query_type_checked_before_length(self):
+        """Test that a wrong type is reported even if another length is wrong."""
+        with self.assertRaises(TypeError) as ctx:
+            create_ping_query(b'a', 'A' * 20)
+        self.assertIn("node_id must be bytes", str(ctx.exception))
+
 
 class TestCreateFindNodeQuery(unittest.TestCase):
     """Test cases for creating find_node query messages."""
@@ -100,6 +123,15 @@ class TestCreateFindNodeQuery(unittest.TestCase):
         self.assertEqual(parsed[b'a'][b'id'], node_id)
         self.assertEqual(parsed[b'a'][b'target'], target_id)
 
+    def test_create_find_node_query_matches_bencode(self):
+        """Test that the find_node query is identical to bencoding the dict."""
+        expected = encode({
+            b't': b'cc', b'y': b'q', b'q': b'find_node',
+            b'a': {b'id': b'C' * 20, b'target': b'D' * 20}
+        })
+
+        self.assertEqual(create_find_node_query(b'cc', b'C' * 20, b'D' * 20), expected)
+
     def test_create_find_node_query_invalid_lengths(self):
         """Test that invalid lengths raise ValueError."""
         # Invalid transaction_id
@@ -154,6 +186,15 @@ class TestCreateGetPeersQuery(unittest.TestCase):
         self.assertEqual(parsed[b'a'][b'id'], node_id)
         self.assertEqual(parsed[b'a'][b'info_hash'], info_hash)
 
+    def test_create_get_peers_query_matches_bencode(self):
+        """Test that the get_peers query is identical to bencoding the dict."""
+        expected = encode({
+            b't': b'dd', b'y': b'q', b'q': b'get_peers',
+            b'a': {b'id': b'D' * 20, b'info_hash': b'I' * 20}
+        })
+
+        self.assertEqual(create_get_peers_query(b'dd', b'D' * 20, b'I' * 20), expected)
+
     def test_create_get_peers_query_invalid_lengths(self):
         """Test that invalid lengths raise ValueError."""
         # Invalid transaction_id
@@ -204,6 +245,13 @@ class TestPackNodes(unittest.TestCase):
         # Should be 78 bytes (3 * 26)
         self.assertEqual(len(packed), 78)
 
+    def test_pack_nodes_wire_format(self):
+        """Test exact compact layout: node_id, IPv4 bytes, big-endian port."""
+        nodes = [(b'A' * 20, '192.168.1.1', 6881)]
+        packed = pack_nodes(nodes)
+
+        self.assertEqual(packed, b'A' * 20 + bytes([192, 168, 1, 1]) + b'\x1a\xe1')
+
     def test_pack_nodes_empty(self):
         """Test packing empty node list."""
         packed = pack_nodes([])
@@ -223,6 +271,13 @@ class TestPackNodes(unittest.TestCase):
             pack_nodes(nodes)
         self.assertIn("Invalid IPv4", str(ctx.exception))
 
+    def test_pack_nodes_rejects_shorthand_ipv4(self):
+        """Test that non-dotted-quad IPv4 shorthand is rejected."""
+        for ip in ['127.1', '1', '192.168.1', '192.168.1.1 ']:
+            with self.assertRaises(ValueError) as ctx:
+                pack_nodes([(b'A' * 20, ip, 6881)])
+            self.assertIn("Invalid IPv4", str(ctx.exception))
+
     def test_pack_nodes_invalid_port(self):
         """Test that invalid port raises ValueError."""
         nodes = [(b'A' * 20, '192.168.1.1', 0)]
@@ -234,6 +289,13 @@ class TestPackNodes(unittest.TestCase):
         with self.assertRaises(ValueError):
             pack_nodes(nodes)
 
+    def test_pack_nodes_port_boundaries(self):
+        """Test that every boundary port in 1-65535 packs and roundtrips."""
+        for port in (1, 2, 255, 256, 6881, 65534, 65535):
+            with self.subTest(port=port):
+                nodes = [(b'A' * 20, '192.168.1.1', port)]
+                self.assertEqual(unpack_nodes(pack_nodes(nodes)), nodes)
+
     def test_pack_nodes_invalid_structure(self):
         """Test that invalid node structure raises ValueError."""
         # Not a tuple
@@ -249,33 +311,100 @@ class TestPackNodes(unittest.TestCase):
         with self.assertRaises(TypeError):
             pack_nodes('not a list')
 
+    def test_pack_nodes_error_after_valid_nodes(self):
+        """Test that an invalid node after valid ones is still reported."""
+        valid = (b'A' * 20, '192.168.1.1', 6881)
+        cases = [
+            ((b'A' * 21, '192.168.1.1', 6881), "20 bytes"),
+            ((b'A' * 20, '256.0.0.1', 6881), "Invalid IPv4"),
+            ((b'A' * 20, '192.168.1.1', 70000), "1-65535"),
+            ((b'A' * 20, '192.168.1.1', -1), "1-65535"),
+        ]
+        for bad, message in cases:
+            with self.subTest(bad=bad):
+                with self.assertRaises(ValueError) as ctx:
+                    pack_nodes([valid, valid, bad])
+                self.assertIn(message, str(ctx.exception))
+
+    def test_pack_nodes_field_types(self):
+        """Test that wrongly typed fields raise the documented errors."""
+        with self.assertRaises(TypeError):
+            pack_nodes([(b'A' * 20, b'192.168.1.1', 6881)])
+
+        with self.assertRaises(TypeError):
+            pack_nodes([(b'A' * 20, '192.168.1.1', 6881.0)])
+
+        with self.assertRaises(ValueError):
+            pack_nodes([(bytearray(b'A' * 20), '192.168.1.1', 6881)])
+
+    def test_pack_nodes_tuple_subclass(self):
+        """Test that tuple subclasses such as namedtuples are accepted."""
+        from collections import namedtuple
+        NodeInfo = namedtuple('NodeInfo', ['node_id', 'ip', 'port'])
+        nodes = [NodeInfo(b'A' * 20, '192.168.1.1', 6881)]
+
+        self.assertEqual(pack_nodes(nodes), pack_nodes([tuple(nodes[0])]))
+
 
 class TestUnpackNodes(unittest.TestCase):
     """Test cases for unpacking nodes from compact format."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Pack the shared node fixtures once for all tests."""
+        cls.ORIGINAL = [
+            (b'A' * 20, '192.168.1.1', 6881),
+            (b'B' * 20, '10.0.0.1', 6882),
+            (b'C' * 20, '172.16.0.1', 6883),
+        ]
+        cls.PACKED = pack_nodes(cls.ORIGINAL)
+        cls.PACKED_SINGLE = cls.PACKED[:26]
+
     def test_unpack_nodes_single(self):
         """Test unpacking single node."""
-        # Pack then unpack
-        original = [(b'A' * 20, '192.168.1.1', 6881)]
-        packed = pack_nodes(original)
-        unpacked = unpack_nodes(packed)
+        unpacked = unpack_nodes(self.PACKED_SINGLE)
 
         self.assertEqual(len(unpacked), 1)
-        self.assertEqual(unpacked[0], original[0])
+        self.assertEqual(unpacked[0], self.ORIGINAL[0])
 
     def test_unpack_nodes_multiple(self):
         """Test unpacking multiple nodes."""
-        original = [
-            (b'A' * 20, '192.168.1.1', 6881),
-            (b'B' * 20, '10.0.0.1', 6882),
-            (b'C' * 20, '172.16.0.1', 6883),
-        ]
-        packed = pack_nodes(original)
-        unpacked = unpack_nodes(packed)
+        unpacked = unpack_nodes(self.PACKED)
 
         self.assertEqual(len(unpacked), 3)
         for i, node in enumerate(unpacked):
-            self.assertEqual(node, original[i])
+            self.assertEqual(node, self.ORIGINAL[i])
+
+    def test_unpack_nodes_wire_format(self):
+        """Test unpacking hand-built compact node bytes."""
+        data = b'Z' * 20 + bytes([10, 0, 0, 7]) + b'\xff\xfe'
+
+        unpacked = unpack_nodes(data)
+
+        self.assertEqual(unpacked, [(b'Z' * 20, '10.0.0.7', 65534)])
+        self.assertIsInstance(unpacked, list)
+        self.assertIsInstance(unpacked[0], tuple)
+
+    def test_unpack_nodes_ip_matches_inet_ntoa(self):
+        """Test that IP strings match socket.inet_ntoa for every octet value."""
+        import socket
+        data = b''.join(
+            b'N' * 20 + bytes([i, 255 - i, i // 2, 0]) + b'\x1a\xe1'
+            for i in range(256)
+        )
+
+        ips = [ip for _, ip, _ in unpack_nodes(data)]
+
+        self.assertEqual(ips, [socket.inet_ntoa(bytes([i, 255 - i, i // 2, 0]))
+                               for i in range(256)])
+
+    def test_unpack_nodes_plain_types(self):
+        """Test that results are plain tuples of bytes, str and int."""
+        packed = pack_nodes([(b'A' * 20, '192.168.1.1', 6881)] * 3)
+
+        for node in unpack_nodes(packed):
+            self.assertIs(type(node), tuple)
+            self.assertEqual([type(field) for field in node], [bytes, str, int])
 
     def test_unpack_nodes_empty(self):
         """Test unpacking empty data."""
@@ -311,6 +440,102 @@ class TestUnpackNodes(unittest.TestCase):
         self.assertEqual(unpacked, original)
 
 
+class TestNodeColumns(unittest.TestCase):
+    """Test cases for column-oriented node packing and unpacking."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create a few nodes in both tuple and column form."""
+        cls.nodes = [
+            (b'A' * 20, '192.168.1.1', 6881),
+            (b'B' * 20, '10.0.0.1', 6882),
+            (b'C' * 20, '172.16.0.1', 65535),
+        ]
+        cls.columns = (
+            (b'A' * 20, b'B' * 20, b'C' * 20),
+            (bytes([192, 168, 1, 1]), bytes([10, 0, 0, 1]), bytes([172, 16, 0, 1])),
+            (6881, 6882, 65535),
+        )
+
+    def test_pack_matches_pack_nodes(self):
+        """Test that column packing produces the same bytes as pack_nodes."""
+        self.assertEqual(pack_nodes_columns(*self.columns), pack_nodes(self.nodes))
+
+    def test_unpack_columns(self):
+        """Test that unpacking yields parallel columns."""
+        self.assertEqual(unpack_nodes_columns(pack_nodes(self.nodes)), self.columns)
+
+    def test_unpack_empty(self):
+        """Test that empty data yields empty columns."""
+        self.assertEqual(unpack_nodes_columns(b''), ((), (), ()))
+        self.assertEqual(pack_nodes_columns([], [], []), b'')
+
+    def test_roundtrip_beyond_single_datagram(self):
+        """Test buffers larger than one UDP datagram use the fallback path."""
+        count = 3000
+        node_ids = tuple(i.to_bytes(20, 'big') for i in range(count))
+        ips = tuple(i.to_bytes(4, 'big') for i in range(count))
+        ports = tuple(i % 65535 + 1 for i in range(count))
+
+        packed = pack_nodes_columns(node_ids, ips, ports)
+
+        self.assertEqual(len(packed), count * 26)
+        self.assertEqual(unpack_nodes_columns(packed), (node_ids, ips, ports))
+
+    def test_pack_invalid_values(self):
+        """Test that invalid column values raise ValueError."""
+        node_ids, ips, ports = self.columns
+        with self.assertRaises(ValueError) as ctx:
+            pack_nodes_columns(node_ids, ips[:2], ports)
+        self.assertIn("same length", str(ctx.exception))
+
+        with self.assertRaises(ValueError) as ctx:
+            pack_nodes_columns((b'short',) + node_ids[1:], ips, ports)
+        self.assertIn("20 bytes", str(ctx.exception))
+
+        with self.assertRaises(ValueError) as ctx:
+            pack_nodes_columns(node_ids, ('192.168.1.1',) + ips[1:], ports)
+        self.assertIn("4 packed bytes", str(ctx.exception))
+
+        with self.assertRaises(ValueError) as ctx:
+            pack_nodes_columns(node_ids, ips, (0,) + ports[1:])
+        self.assertIn("1-65535", str(ctx.exception))
+
+    def test_unpack_invalid_data(self):
+        """Test that malformed data raises errors."""
+        with self.assertRaises(ValueError):
+            unpack_nodes_columns(b'A' * 25)
+
+        with self.assertRaises(TypeError):
+            unpack_nodes_columns('not bytes')
+
+
+class TestUnpackPeers(unittest.TestCase):
+    """Test cases for unpacking compact peers from get_peers values."""
+
+    def test_unpack_peers_valid(self):
+        """Test unpacking compact peer strings."""
+        values = [
+            bytes([192, 168, 1, 1]) + (6881).to_bytes(2, 'big'),
+            bytes([10, 0, 0, 1]) + (65535).to_bytes(2, 'big'),
+        ]
+
+        self.assertEqual(unpack_peers(values),
+                         [('192.168.1.1', 6881), ('10.0.0.1', 65535)])
+
+    def test_unpack_peers_skips_malformed(self):
+        """Test that malformed entries are skipped."""
+        valid = bytes([192, 168, 1, 1]) + (6881).to_bytes(2, 'big')
+        values = [b'short', valid, 12345, valid + b'x', [valid]]
+
+        self.assertEqual(unpack_peers(values), [('192.168.1.1', 6881)])
+
+    def test_unpack_peers_invalid_type(self):
+        """Test that non-list values raise TypeError."""
+        with self.assertRaises(TypeError):
+            unpack_peers(b'not a list')
+
+
 class TestParseMessage(unittest.TestCase):
     """Test cases for parsing DHT messages."""
 
@@ -347,7 +572,6 @@ class TestParseMessage(unittest.TestCase):
 
     def test_parse_message_not_dictionary(self):
         """Test that non-dictionary message raises ValueError."""
-        from bencode import encode
         # Encode a list instead of dict
         with self.assertRaises(ValueError) as ctx:
             parse_message(encode([1, 2, 3]))
@@ -355,7 +579,6 @@ class TestParseMessage(unittest.TestCase):
 
     def test_parse_message_missing_type_field(self):
         """Test that message without 'y' field raises ValueError."""
-        from bencode import encode
         msg = encode({b't': b'aa', b'q': b'ping'})  # Missing 'y'
         with self.assertRaises(ValueError) as ctx:
             parse_message(msg)
@@ -363,7 +586,6 @@ class TestParseMessage(unittest.TestCase):
 
     def test_parse_message_invalid_type(self):
         """Test that invalid message type raises ValueError."""
-        from bencode import encode
         msg = encode({b'y': b'x', b't': b'aa'})  # Invalid type 'x'
         with self.assertRaises(ValueError) as ctx:
             parse_message(msg)
@@ -371,12 +593,111 @@ class TestParseMessage(unittest.TestCase):
 
     def test_parse_message_missing_transaction_id(self):
         """Test that message without transaction ID raises ValueError."""
-        from bencode import encode
         msg = encode({b'y': b'q', b'q': b'ping'})  # Missing 't'
         with self.assertRaises(ValueError) as ctx:
             parse_message(msg)
         self.assertIn("'t'", str(ctx.exception))
 
+    def test_parse_message_unhashable_type(self):
+        """Test that a non-string message type raises ValueError."""
+        msg = encode({b'y': [b'q'], b't': b'aa'})
+        with self.assertRaises(ValueError) as ctx:
+            parse_message(msg)
+        self.assertIn("Invalid message type", str(ctx.exception))
+
+    def test_parse_message_query_missing_arguments(self):
+        """Test that a query without 'q' or 'a' raises ValueError."""
+        with self.assertRaises(ValueError) as ctx:
+            parse_message(encode({b't': b'aa', b'y': b'q', b'a': {b'id': b'A' * 20}}))
+        self.assertIn("'q'", str(ctx.exception))
+
+        with self.assertRaises(ValueError) as ctx:
+            parse_message(encode({b't': b'aa', b'y': b'q', b'q': b'ping'}))
+        self.assertIn("'a'", str(ctx.exception))
+
+    def test_parse_message_query_invalid_arguments(self):
+        """Test that known queries have their arguments validated."""
+        cases = [
+            (b'ping', {b'id': b'short'}, "b'id'"),
+            (b'find_node', {b'id': b'A' * 20}, "b'target'"),
+            (b'get_peers', {b'id': b'A' * 20, b'info_hash': 5}, "b'info_hash'"),
+            (b'announce_peer', {b'id': b'A' * 20, b'info_hash': b'B' * 20,
+                                b'port': 6881}, "b'token'"),
+            (b'announce_peer', {b'id': b'A' * 20, b'info_hash': b'B' * 20,
+                                b'token': b'tk'}, "b'port'"),
+        ]
+        for query_type, args, field in cases:
+            msg = encode({b't': b'aa', b'y': b'q', b'q': query_type, b'a': args})
+            with self.subTest(query_type=query_type, field=field):
+                with self.assertRaises(ValueError) as ctx:
+                    parse_message(msg)
+                self.assertIn(field, str(ctx.exception))
+
+    def test_parse_message_announce_peer_implied_port(self):
+        """Test that announce_peer may omit the port when implied_port is set."""
+        msg = encode({b't': b'aa', b'y': b'q', b'q': b'announce_peer', b'a': {
+            b'id': b'A' * 20, b'info_hash': b'B' * 20,
+            b'implied_port': 1, b'token': b'tk'}})
+        parsed = parse_message(msg)
+        self.assertEqual(parsed[b'q'], b'announce_peer')
+
+    def test_parse_message_unknown_query_passes_through(self):
+        """Test that unrecognized query types are returned unchanged."""
+        msg = encode({b't': b'aa', b'y': b'q', b'q': b'sample_infohashes',
+                      b'a': {b'id': b'A' * 20, b'target': b'B' * 20}})
+        parsed = parse_message(msg)
+        self.assertEqual(parsed[b'q'], b'sample_infohashes')
+
+    def test_parse_message_response_with_nested_values(self):
+        """Test parsing a response mixing strings, nested dicts, lists and ints."""
+        message = {
+            b't': b'aa',
+            b'y': b'r',
+            b'r': {
+                b'id': b'A' * 20,
+                b'token': b'tok',
+                b'values': [b'P' * 6, b'Q' * 6],
+                b'interval': 21600,
+            }
+        }
+
+        parsed = parse_message(encode(message))
+
+        self.assertEqual(parsed, message)
+
+    def test_parse_message_truncated_dict(self):
+        """Test that a truncated message raises ValueError."""
+        msg = create_ping_query(b'aa', b'A' * 20)
+
+        for cut in (5, 20, len(msg) - 1):
+            with self.assertRaises(ValueError) as ctx:
+                parse_message(msg[:cut])
+            self.assertIn("Invalid bencode", str(ctx.exception))
+
+    def test_parse_message_leading_zero_length(self):
+        """Test that non-canonical string lengths are still rejected."""
+        with self.assertRaises(ValueError) as ctx:
+            parse_message(b'd1:t02:aa1:y1:qe')
+        self.assertIn("Invalid bencode", str(ctx.exception))
+
+    def test_parse_message_repeated_packet(self):
+        """Test that identical packets parse to equal, independent dicts."""
+        msg = create_ping_query(b'rp', b'R' * 20)
+
+        first = parse_message(msg)
+        first[b'y'] = b'x'  # Mutating the top level must not leak
+        second = parse_message(msg)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second[b'y'], b'q')
+        self.assertEqual(second[b'a'][b'id'], b'R' * 20)
+
+    def test_parse_message_repeated_invalid_packet(self):
+        """Test that a malformed packet raises on every attempt."""
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                parse_message(b'd1:t2:aae')
+
     def test_parse_message_invalid_type_arg(self):
         """Test that non-bytes input raises TypeError."""
         with self.assertRaises(TypeError):
@@ -388,16 +709,12 @@ class TestPackSamples(unittest.TestCase):
 
     def test_pack_samples_empty(self):
         """Test packing empty list returns empty bytes."""
-        from protocol import pack_samples
-
         result = pack_samples([])
         self.assertEqual(result, b'')
         self.assertIsInstance(result, bytes)
 
     def test_pack_samples_single(self):
         """Test packing single info_hash."""
-        from protocol import pack_samples
-
         info_hash = b'A' * 20
         result = pack_samples([info_hash])
 
@@ -406,8 +723,6 @@ class TestPackSamples(unittest.TestCase):
 
     def test_pack_samples_multiple(self):
         """Test packing multiple info_hashes."""
-        from protocol import pack_samples
-
         hash1 = b'A' * 20
         hash2 = b'B' * 20
         hash3 = b'C' * 20
@@ -419,8 +734,6 @@ class TestPackSamples(unittest.TestCase):
 
     def test_pack_samples_max_limit(self):
         """Test that packing respects max 20 sample limit."""
-        from protocol import pack_samples
-
         # Create 25 different hashes
         hashes = [bytes([i] * 20) for i in range(25)]
 
@@ -431,8 +744,6 @@ class TestPackSamples(unittest.TestCase):
 
     def test_pack_samples_invalid_length(self):
         """Test that invalid info_hash length raises ValueError."""
-        from protocol import pack_samples
-
         invalid_hash = b'short'
 
         with self.assertRaises(ValueError) as ctx:
@@ -441,8 +752,6 @@ class TestPackSamples(unittest.TestCase):
 
     def test_pack_samples_invalid_type(self):
         """Test that non-bytes info_hash raises TypeError."""
-        from protocol import pack_samples
-
         with self.assertRaises(TypeError):
             pack_samples(['not bytes'])
 
@@ -452,16 +761,12 @@ class TestUnpackSamples(unittest.TestCase):
 
     def test_unpack_samples_empty(self):
         """Test unpacking empty data returns empty list."""
-        from protocol import unpack_samples
-
         result = unpack_samples(b'')
         self.assertEqual(result, [])
         self.assertIsInstance(result, list)
 
     def test_unpack_samples_single(self):
         """Test unpacking single sample."""
-        from protocol import unpack_samples
-
         data = b'A' * 20
         result = unpack_samples(data)
 
@@ -470,8 +775,6 @@ class TestUnpackSamples(unittest.TestCase):
 
     def test_unpack_samples_multiple(self):
         """Test unpacking multiple samples."""
-        from protocol import unpack_samples
-
         hash1 = b'A' * 20
         hash2 = b'B' * 20
         hash3 = b'C' * 20
@@ -486,8 +789,6 @@ class TestUnpackSamples(unittest.TestCase):
 
     def test_unpack_samples_invalid_length(self):
         """Test that non-multiple-of-20 length raises ValueError."""
-        from protocol import unpack_samples
-
         # 25 bytes (not a multiple of 20)
         invalid_data = b'A' * 25
 
@@ -497,15 +798,11 @@ class TestUnpackSamples(unittest.TestCase):
 
     def test_unpack_samples_invalid_type(self):
         """Test that non-bytes data raises TypeError."""
-        from protocol import unpack_samples
-
         with self.assertRaises(TypeError):
             unpack_samples('not bytes')
 
     def test_pack_unpack_roundtrip(self):
         """Test that pack/unpack roundtrip preserves data."""
-        from protocol import pack_samples, unpack_samples
-
         original_hashes = [b'A' * 20, b'B' * 20, b'C' * 20, b'D' * 20]
 
         packed = pack_samples(original_hashes)
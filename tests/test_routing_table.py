@@ -7,9 +7,12 @@ This test suite validates the routing table implementation used in the DHT.
 import unittest
 import sys
 import os
+from collections import deque
 
 # Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_DIR not in sys.path:  # Only once when several test modules are loaded
+    sys.path.insert(0, SRC_DIR)
 
 from routing_table import RoutingTable
 from node import Node
@@ -76,9 +79,10 @@ class TestRoutingTableInit(unittest.TestCase):
         """Test that all buckets start empty."""
         table = RoutingTable(b'A' * 20)
 
+        self.assertIsInstance(table.buckets, tuple)
         for bucket in table.buckets:
             self.assertEqual(len(bucket), 0)
-            self.assertIsInstance(bucket, list)
+            self.assertIsInstance(bucket, deque)
 
 
 class TestGetBucketIndex(unittest.TestCase):
@@ -119,6 +123,21 @@ class TestGetBucketIndex(unittest.TestCase):
         target2 = b'\x20' + b'\x00' * 19
         self.assertEqual(table.get_bucket_index(target2), 157)
 
+    def test_bucket_index_matches_distance(self):
+        """Test that the bucket index is the MSB position of the XOR distance."""
+        from node import distance
+        local_id = bytes(range(20))
+        table = RoutingTable(local_id)
+
+        for i in range(160):
+            # Flip bit i (counted from the least significant end)
+            target_int = int.from_bytes(local_id, 'big') ^ (1 << i)
+            target = target_int.to_bytes(20, 'big')
+            with self.subTest(bit=i):
+                self.assertEqual(table.get_bucket_index(target), i)
+                self.assertEqual(table.get_bucket_index(target),
+                                 distance(local_id, target).bit_length() - 1)
+
     def test_bucket_index_invalid_length(self):
         """Test that invalid target_id length raises ValueError."""
         table = RoutingTable(b'A' * 20)
@@ -168,6 +187,30 @@ class TestAddNode(unittest.TestCase):
         # Second add returns False (already exists)
         self.assertFalse(table.add_node(node))
 
+    def test_add_node_same_id_different_address(self):
+        """Test that a known ID with a new address does not add a second entry."""
+        table = RoutingTable(b'A' * 20)
+        original = Node(b'B' * 20, '192.168.1.1', 6881)
+        moved = Node(b'B' * 20, '10.0.0.1', 6882)
+
+        self.assertTrue(table.add_node(original))
+        self.assertFalse(table.add_node(moved))
+
+        bucket = table.buckets[table.get_bucket_index(b'B' * 20)]
+        self.assertEqual(list(bucket), [original])
+
+    def test_add_node_duplicate_refreshes_lru(self):
+        """Test that re-adding a known node moves it to the end of its bucket."""
+        table = RoutingTable(b'\x00' * 20, k=8)
+        node_a = Node(b'\x00' * 19 + b'\x04', '192.168.1.1', 6881)
+        node_b = Node(b'\x00' * 19 + b'\x05', '192.168.1.2', 6881)
+        table.add_node(node_a)
+        table.add_node(node_b)
+
+        self.assertFalse(table.add_node(node_a))
+
+        self.assertEqual(list(table.buckets[2]), [node_b, node_a])
+
     def test_add_node_bucket_placement(self):
         """Test that nodes are added to correct bucket."""
         table = RoutingTable(b'\x00' * 20, k=8)
@@ -260,6 +303,73 @@ class TestAddNode(unittest.TestCase):
         self.assertEqual(len(set(bucket_indices)), 3)  # All in different buckets
 
 
+class TestAddNodes(unittest.TestCase):
+    """Test cases for adding several nodes at once."""
+
+    def test_add_nodes_matches_add_node(self):
+        """Test that bulk adding fills buckets exactly like add_node."""
+        nodes = [
+            Node(bytes([i % 7]) + bytes([i]) * 19, '192.168.1.1', 6881 + i)
+            for i in range(1, 120)
+        ]
+        single = RoutingTable(b'\x00' * 20, k=4)
+        bulk = RoutingTable(b'\x00' * 20, k=4)
+
+        expected = sum(single.add_node(node) for node in nodes)
+        added = bulk.add_nodes(nodes)
+
+        self.assertEqual(added, expected)
+        self.assertEqual(bulk.buckets, single.buckets)
+
+    def test_add_nodes_skips_self_and_duplicates(self):
+        """Test that the local ID and known nodes are not added."""
+        table = RoutingTable(b'A' * 20)
+        node = Node(b'B' * 20, '192.168.1.1', 6881)
+
+        added = table.add_nodes([
+            node,
+            Node(b'A' * 20, '192.168.1.2', 6881),
+            node,
+            Node(b'B' * 20, '10.0.0.1', 6882),
+        ])
+
+        self.assertEqual(added, 1)
+        self.assertEqual(table.get_closest_nodes(b'B' * 20, count=10), [node])
+
+    def test_add_nodes_invalidates_closest_cache(self):
+        """Test that bulk adds refresh cached closest-node results."""
+        table = RoutingTable(b'A' * 20)
+        self.assertEqual(table.get_closest_nodes(b'B' * 20), [])
+
+        node = Node(b'B' * 20, '192.168.1.1', 6881)
+        table.add_nodes([node])
+
+        self.assertEqual(table.get_closest_nodes(b'B' * 20), [node])
+
+    def test_add_nodes_partial_batch_invalidates_closest_cache(self):
+        """Test that nodes added before an invalid element refresh the cache."""
+        table = RoutingTable(b'\x00' * 20)
+        far_node = Node(b'\xff' * 20, '192.168.1.1', 6881)
+        near_node = Node(b'\x00' * 19 + b'\x01', '192.168.1.2', 6881)
+        target = b'\x00' * 19 + b'\x02'
+
+        table.add_node(far_node)
+        self.assertEqual(table.get_closest_nodes(target, count=1), [far_node])
+
+        with self.assertRaises(TypeError):
+            table.add_nodes([near_node, 'junk'])
+
+        self.assertEqual(table.get_closest_nodes(target, count=1), [near_node])
+
+    def test_add_nodes_invalid_type(self):
+        """Test that non-Node elements raise TypeError."""
+        table = RoutingTable(b'A' * 20)
+
+        with self.assertRaises(TypeError) as ctx:
+            table.add_nodes([b'B' * 20])
+        self.assertIn("Node object", str(ctx.exception))
+
+
 class TestRemoveNode(unittest.TestCase):
     """Test cases for removing nodes from routing table."""
 
@@ -295,6 +405,16 @@ class TestRemoveNode(unittest.TestCase):
         # Second removal fails
         self.assertFalse(table.remove_node(node))
 
+    def test_remove_node_re_added_after_removal(self):
+        """Test that a removed node can be added again."""
+        table = RoutingTable(b'A' * 20)
+        node = Node(b'B' * 20, '192.168.1.1', 6881)
+
+        table.add_node(node)
+        table.remove_node(node)
+
+        self.assertTrue(table.add_node(node))
+
     def test_remove_node_invalid_type(self):
         """Test that removing non-Node object raises TypeError."""
         table = RoutingTable(b'A' * 20)
@@ -320,6 +440,59 @@ class TestRemoveNode(unittest.TestCase):
         # Verify node is no longer in bucket
         self.assertNotIn(node, table.buckets[bucket_index])
 
+    def test_remove_node_same_id_different_address(self):
+        """Test that a node with a known ID but another address is not removed."""
+        table = RoutingTable(b'A' * 20)
+        node = Node(b'B' * 20, '192.168.1.1', 6881)
+        impostor = Node(b'B' * 20, '10.0.0.1', 6881)
+
+        table.add_node(node)
+        bucket_index = table.get_bucket_index(node.node_id)
+
+        self.assertFalse(table.remove_node(impostor))
+        self.assertEqual(list(table.buckets[bucket_index]), [node])
+
+        # The original entry is still removable afterwards
+        self.assertTrue(table.remove_node(node))
+        self.assertEqual(list(table.nonempty_buckets()), [])
+
+
+class TestNonemptyBuckets(unittest.TestCase):
+    """Test cases for iterating over occupied buckets."""
+
+    def test_nonempty_buckets_empty_table(self):
+        """Test that an empty table has no occupied buckets."""
+        table = RoutingTable(b'A' * 20)
+
+        self.assertEqual(list(table.nonempty_buckets()), [])
+
+    def test_nonempty_buckets_tracks_add_and_remove(self):
+        """Test that buckets are reported while they hold nodes."""
+        table = RoutingTable(b'\x00' * 20, k=8)
+        node_0 = Node(b'\x00' * 19 + b'\x01', '192.168.1.1', 6881)      # Bucket 0
+        node_2a = Node(b'\x00' * 19 + b'\x04', '192.168.1.2', 6881)     # Bucket 2
+        node_2b = Node(b'\x00' * 19 + b'\x05', '192.168.1.3', 6881)     # Bucket 2
+        node_159 = Node(b'\x80' + b'\x00' * 19, '192.168.1.4', 6881)    # Bucket 159
+        table.add_nodes([node_159, node_2a, node_0, node_2b])
+
+        self.assertEqual(list(table.nonempty_buckets()), [0, 2, 159])
+
+        table.remove_node(node_2a)
+        self.assertEqual(list(table.nonempty_buckets()), [0, 2, 159])
+
+        table.remove_node(node_2b)
+        table.remove_node(node_0)
+        self.assertEqual(list(table.nonempty_buckets()), [159])
+
+    def test_nonempty_buckets_matches_bucket_contents(self):
+        """Test that the bitmap agrees with the buckets themselves."""
+        table = RoutingTable(b'A' * 20)
+        for i in range(50):
+            table.add_node(Node(bytes([i * 5]) + b'\x00' * 19, '192.168.1.1', 6881 + i))
+
+        expected = [i for i, bucket in enumerate(table.buckets) if bucket]
+        self.assertEqual(list(table.nonempty_buckets()), expected)
+
 
 class TestGetClosestNodes(unittest.TestCase):
     """Test cases for finding closest nodes."""
@@ -407,6 +580,91 @@ class TestGetClosestNodes(unittest.TestCase):
 
         self.assertEqual(len(closest), 3)
 
+    def test_get_closest_matches_full_scan(self):
+        """Test that the bucket walk returns exactly the closest nodes overall."""
+        import random
+        rng = random.Random(1234)
+        local_id = bytes(rng.getrandbits(8) for _ in range(20))
+        table = RoutingTable(local_id, k=8)
+
+        # Mix of random IDs (mostly far buckets) and IDs near the local node
+        local_int = int.from_bytes(local_id, 'big')
+        for i in range(400):
+            if i % 2:
+                node_int = rng.getrandbits(160)
+            else:
+                node_int = local_int ^ rng.getrandbits(rng.randint(1, 40))
+            if node_int == local_int:
+                continue
+            table.add_node(Node(node_int.to_bytes(20, 'big'), '10.0.0.1', 1 + i))
+
+        stored = [node for bucket in table.buckets for node in bucket]
+        targets = [local_id, stored[0].node_id, stored[-1].node_id]
+        targets += [bytes(rng.getrandbits(8) for _ in range(20)) for _ in range(20)]
+        targets += [(local_int ^ rng.getrandbits(30)).to_bytes(20, 'big') for _ in range(20)]
+
+        for target in targets:
+            target_int = int.from_bytes(target, 'big')
+            expected = sorted(stored, key=lambda n: int.from_bytes(n.node_id, 'big') ^ target_int)
+            for count in (1, 3, 8, 20, 1000):
+                with self.subTest(target=target.hex(), count=count):
+                    self.assertEqual(table.get_closest_nodes(target, count=count),
+                                     expected[:count])
+
+    def test_get_closest_from_target_bucket_only(self):
+        """Test that a target bucket holding enough nodes answers on its own."""
+        table = RoutingTable(b'\x00' * 20, k=8)
+        # Bucket 7: XOR distances 0x80-0xff; other buckets also populated
+        bucket_nodes = [Node(b'\x00' * 19 + bytes([0x80 + i]), '192.168.1.1', 6881 + i)
+                        for i in range(8)]
+        other_nodes = [Node(b'\x00' * 19 + bytes([i]), '192.168.1.2', 6881 + i)
+                       for i in range(1, 8)]
+        table.add_nodes(bucket_nodes + other_nodes)
+        target = b'\x00' * 19 + b'\x85'
+
+        result = table.get_closest_nodes(target, count=4)
+
+        expected = sorted(bucket_nodes, key=lambda n: n.node_id[-1] ^ 0x85)[:4]
+        self.assertEqual(result, expected)
+
+    def test_get_closest_cached_result_is_copy(self):
+        """Test that repeated lookups return equal but independent lists."""
+        table = RoutingTable(b'A' * 20)
+        table.add_node(Node(b'B' * 20, '192.168.1.1', 6881))
+        table.add_node(Node(b'C' * 20, '192.168.1.2', 6881))
+
+        first = table.get_closest_nodes(b'D' * 20)
+        first.clear()
+        second = table.get_closest_nodes(b'D' * 20)
+
+        self.assertEqual(len(second), 2)
+
+    def test_get_closest_cache_invalidated(self):
+        """Test that adding or removing nodes refreshes cached results."""
+        table = RoutingTable(b'\x00' * 20)
+        far = Node(b'\x80' + b'\x00' * 19, '192.168.1.1', 6881)
+        near = Node(b'\x00' * 19 + b'\x01', '192.168.1.2', 6881)
+        target = b'\x00' * 19 + b'\x03'
+
+        table.add_node(far)
+        self.assertEqual(table.get_closest_nodes(target, count=1), [far])
+
+        table.add_node(near)
+        self.assertEqual(table.get_closest_nodes(target, count=1), [near])
+
+        table.remove_node(near)
+        self.assertEqual(table.get_closest_nodes(target, count=1), [far])
+
+    def test_get_closest_cache_bounded(self):
+        """Test that the result cache does not grow past its limit."""
+        table = RoutingTable(b'A' * 20)
+        table.add_node(Node(b'B' * 20, '192.168.1.1', 6881))
+
+        for i in range(RoutingTable.CLOSEST_CACHE_SIZE + 10):
+            table.get_closest_nodes(i.to_bytes(20, 'big'))
+
+        self.assertEqual(len(table._closest_cache), RoutingTable.CLOSEST_CACHE_SIZE)
+
     def test_get_closest_invalid_target_length(self):
         """Test that invalid target_id length raises ValueError."""
         table = RoutingTable(b'A' * 20)